@@ -1,6 +1,7 @@
 """RSS Monk API - Authenticated proxy to Listmonk with RSS processing capabilities."""
 
 import os
+from contextlib import asynccontextmanager
 from http import HTTPStatus
 import httpx
 from fastapi import Depends, FastAPI, HTTPException, Request
@@ -8,6 +9,7 @@ from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBasicCredentials
 from rssmonk.shared import settings, security
 
+from rssmonk.cache import close_feed_client
 from rssmonk.core import RSSMonk
 from rssmonk.logging_config import get_logger
 from rssmonk.models import ErrorResponse
@@ -33,8 +35,17 @@ swagger_ui_params = (
     }
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close the pooled feed fetching connections when the service shuts down."""
+    yield
+    await close_feed_client()
+
+
 # FastAPI app with comprehensive OpenAPI configuration
 app = FastAPI(
+    lifespan=lifespan,
     title="RSS Monk API",
     version="0.2.1",
     description="""
@@ -91,7 +102,7 @@ RSS Monk uses Listmonk lists as the source of truth:
 
 async def validate_auth(credentials: HTTPBasicCredentials = Depends(security)) -> tuple[str, str]:
     """Validate credentials against Listmonk API."""
-    logger.info(f"Auth attempt: user={credentials.username}, expected_user={settings.listmonk_admin_username}")
+    logger.info("Auth attempt: user=%s, expected_user=%s", credentials.username, settings.listmonk_admin_username)
     if settings.validate_admin_auth(credentials.username, credentials.password):
         return credentials.username, credentials.password
 
@@ -131,7 +142,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle unexpected exceptions."""
-    logger.error(f"Unexpected error: {exc}", exc_info=True)
+    logger.error("Unexpected error: %s", exc, exc_info=True)
     return JSONResponse(
         status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
         content=ErrorResponse(error="Internal server error", detail=str(exc)).model_dump(),
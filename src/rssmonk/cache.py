@@ -1,9 +1,11 @@
 """Caching system using diskcache for RSS feeds and templates."""
 
+import asyncio
 import hashlib
 import os
+import weakref
 from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple
 import httpx
 import feedparser
@@ -27,10 +29,61 @@ def get_cache() -> Cache:
     global _cache
     if _cache is None:
         _cache = Cache(CACHE_DIR, size_limit=100 * 1024 * 1024)  # 100MB limit
-        logger.info(f"Initialised diskcache at {CACHE_DIR}")
+        logger.info("Initialised diskcache at %s", CACHE_DIR)
     return _cache
 
 
+# Feed fetches reuse one client per event loop so keep-alive connections to feed hosts are pooled across polls.
+# Async connections belong to the loop that opened them, so clients aren't shared between loops.
+_feed_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_feed_client() -> httpx.AsyncClient:
+    """Get or create the feed fetching client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _feed_clients.get(loop)
+    if client is None:
+        client = _feed_clients[loop] = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+        )
+    return client
+
+
+async def close_feed_client():
+    """Close the feed fetching client for the running event loop, if one was opened."""
+    client = _feed_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _parse_feed(content: bytes, url: str) -> Tuple[list[FeedItem], str, Optional[str]]:
+    """Parse raw feed content into articles, the feed title and any parser complaint."""
+    feed_data: feedparser.FeedParserDict = feedparser.parse(content)
+
+    articles: list[FeedItem] = []
+    for entry in feed_data.entries:
+        # feedparser has already parsed the date into UTC, so it is only converted here, never re-parsed
+        published_parsed = entry.get("published_parsed")
+        article = FeedItem(
+            title=entry.get("title", ""),
+            link=entry.get("link", ""),
+            description=entry.get("description", ""),
+            published=datetime(*published_parsed[:6], tzinfo=timezone.utc).isoformat() if published_parsed else "",
+            guid=entry.get("id", entry.get("link", "")),
+            email_subject_line=entry.get("wa:subject_line", ""),
+            filter_identifiers=entry.get("wa:identifiers", ""),
+        )
+        articles.append(article)
+
+    # Get feed title safely
+    feed_title = url
+    if feed_data.feed:
+        feed_title = feed_data.feed.get("title", url)  # type: ignore[union-attr]
+
+    bozo_exception = str(feed_data.bozo_exception) if feed_data.bozo else None
+    return articles, feed_title, bozo_exception
+
+
 def close_cache():
     """Close the cache connection."""
     global _cache
@@ -84,9 +137,10 @@ class FeedCache:
     def __init__(self, default_ttl_minutes: int = 60):
         self.default_ttl_minutes = default_ttl_minutes
 
-    def _generate_content_hash(self, content: str) -> str:
+    def _generate_content_hash(self, content: bytes) -> str:
         """Generate hash of RSS feed content."""
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        # Only compared against the previous fetch, so a short blake2b digest is enough and cheaper than sha256
+        return hashlib.blake2b(content, digest_size=8).hexdigest()
 
     def _get_cache_key(self, url: str) -> str:
         """Get cache key for URL."""
@@ -115,96 +169,85 @@ class FeedCache:
 
         headers = {"User-Agent": user_agent}
 
-        # Add conditional request headers if we have cached data
-        if cached_feed and not cached_feed.is_expired():
+        # Add conditional request headers whenever we have cached data. An expired entry still holds the
+        # articles, so a 304 lets it be reused instead of downloading and parsing an unchanged feed.
+        if cached_feed:
             if cached_feed.etag:
                 headers["If-None-Match"] = cached_feed.etag
             if cached_feed.last_modified:
                 headers["If-Modified-Since"] = cached_feed.last_modified
 
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(url + FEED_URL_RSSMONK_QUERY, headers=headers)
-
-                # Handle 304 Not Modified
-                if response.status_code == 304 and cached_feed:
-                    logger.info(f"Feed unchanged (304): {url}")
-                    # Update cache expiry but keep same content
-                    cached_feed.expires_at = (datetime.now() + timedelta(minutes=self.default_ttl_minutes)).isoformat()
-                    self._set_cached(url, cached_feed)
-                    return cached_feed.get_articles(), cached_feed.feed_title
-
-                response.raise_for_status()
-
-                # Parse feed content
-                content = response.text
-                content_hash = self._generate_content_hash(content)
-
-                # Check if content actually changed
-                if cached_feed and cached_feed.content_hash == content_hash:
-                    logger.info(f"Feed content unchanged: {url}")
-                    cached_feed.expires_at = (datetime.now() + timedelta(minutes=self.default_ttl_minutes)).isoformat()
-                    self._set_cached(url, cached_feed)
-                    return cached_feed.get_articles(), cached_feed.feed_title
-
-                # Parse new content
-                feed_data: feedparser.FeedParserDict = feedparser.parse(content)
-
-                if feed_data.bozo:
-                    logger.warning(f"Feed has issues: {feed_data.bozo_exception}")
-
-                articles: list[FeedItem] = []
-                for entry in feed_data.entries:
-                    article = FeedItem(
-                        title=entry.get("title", ""),
-                        link=entry.get("link", ""),
-                        description=entry.get("description", ""),
-                        published=entry.get("pubDate", ""),
-                        guid=entry.get("id", entry.get("link", "")),
-                        email_subject_line=entry.get("wa:subject_line", ""),
-                        filter_identifiers=entry.get("wa:identifiers", ""),
-                    )
-                    articles.append(article)
-
-                # Create cache entry - store articles as dicts for serialisation
-                now = datetime.now()
-                # Get feed title safely
-                feed_title = url
-                if feed_data.feed:
-                    feed_title = feed_data.feed.get("title", url)  # type: ignore[union-attr]
-
-                new_cached = CachedFeed(
-                    url=url,
-                    url_hash=hashlib.sha256(url.encode()).hexdigest(),
-                    content_hash=content_hash,
-                    etag=response.headers.get("ETag"),
-                    last_modified=response.headers.get("Last-Modified"),
-                    articles=[asdict(a) for a in articles],
-                    cached_at=now.isoformat(),
-                    expires_at=(now + timedelta(minutes=self.default_ttl_minutes)).isoformat(),
-                    feed_title=feed_title,
-                )
-
-                self._set_cached(url, new_cached)
-                logger.info(f"Cached feed: {url} ({len(articles)} articles)")
-                return articles, new_cached.feed_title
+            response = await get_feed_client().get(url + FEED_URL_RSSMONK_QUERY, headers=headers, timeout=timeout)
+
+            # Handle 304 Not Modified
+            if response.status_code == 304 and cached_feed:
+                logger.info("Feed unchanged (304): %s", url)
+                # Update cache expiry but keep same content
+                cached_feed.expires_at = (datetime.now() + timedelta(minutes=self.default_ttl_minutes)).isoformat()
+                self._set_cached(url, cached_feed)
+                return cached_feed.get_articles(), cached_feed.feed_title
+
+            response.raise_for_status()
+
+            # Parse feed content from the raw bytes, feedparser works out the encoding from the XML itself
+            # and the body isn't decoded into a second, text copy first
+            content = response.content
+            content_hash = self._generate_content_hash(content)
+
+            # Check if content actually changed
+            if cached_feed and cached_feed.content_hash == content_hash:
+                logger.info("Feed content unchanged: %s", url)
+                cached_feed.expires_at = (datetime.now() + timedelta(minutes=self.default_ttl_minutes)).isoformat()
+                self._set_cached(url, cached_feed)
+                return cached_feed.get_articles(), cached_feed.feed_title
+
+            # Parse new content in a worker thread, parsing a large feed would otherwise hold up the other feeds
+            articles, feed_title, bozo_exception = await asyncio.to_thread(_parse_feed, content, url)
+
+            if bozo_exception:
+                logger.warning("Feed has issues: %s", bozo_exception)
+
+            # Create cache entry - store articles as dicts for serialisation
+            now = datetime.now()
+
+            new_cached = CachedFeed(
+                url=url,
+                url_hash=hashlib.sha256(url.encode()).hexdigest(),
+                content_hash=content_hash,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                articles=[asdict(a) for a in articles],
+                cached_at=now.isoformat(),
+                expires_at=(now + timedelta(minutes=self.default_ttl_minutes)).isoformat(),
+                feed_title=feed_title,
+            )
+
+            self._set_cached(url, new_cached)
+            logger.info("Cached feed: %s (%s articles)", url, len(articles))
+            return articles, new_cached.feed_title
 
         except Exception as e:
-            logger.error(f"Error fetching feed {url}: {e}")
+            logger.error("Error fetching feed %s: %s", url, e)
 
             # Return cached data if available and not too old
             if cached_feed and cached_feed.is_fresh(max_age_minutes=240):  # 4 hours fallback
-                logger.info(f"Using stale cache for failed fetch: {url}")
+                logger.info("Using stale cache for failed fetch: %s", url)
                 return cached_feed.get_articles(), cached_feed.feed_title
 
             return [], None
 
+    def get_cached_title(self, url: str) -> Optional[str]:
+        """Get a cached feed's title without fetching the feed."""
+        cached_feed = self._get_cached(url)
+        return cached_feed.feed_title if cached_feed else None
+
     def invalidate_url(self, url: str):
         """Invalidate cache for specific URL."""
         cache = get_cache()
         key = self._get_cache_key(url)
         if cache.delete(key):
-            logger.info(f"Invalidated feed cache: {url}")
+            logger.info("Invalidated feed cache: %s", url)
 
     def clear(self):
         """Clear all feed cache entries."""
@@ -214,7 +257,7 @@ class FeedCache:
             if isinstance(key, str) and key.startswith(self.CACHE_PREFIX):
                 cache.delete(key)
                 count += 1
-        logger.info(f"Cleared {count} feed cache entries")
+        logger.info("Cleared %s feed cache entries", count)
 
     def get_stats(self) -> dict:
         """Get cache statistics."""
@@ -264,7 +307,7 @@ class TemplateCache:
         cache = get_cache()
         key = self._get_cache_key(feed_hash, phase_type)
         cache.set(key, template_data, expire=self.ttl_seconds)
-        logger.debug(f"Cached template: {feed_hash}:{phase_type}")
+        logger.debug("Cached template: %s:%s", feed_hash, phase_type)
 
     def invalidate(self, feed_hash: str, phase_type: Optional[str] = None):
         """Invalidate cached template(s) for a feed.
@@ -275,7 +318,7 @@ class TemplateCache:
         if phase_type:
             key = self._get_cache_key(feed_hash, phase_type)
             if cache.delete(key):
-                logger.info(f"Invalidated template cache: {feed_hash}:{phase_type}")
+                logger.info("Invalidated template cache: %s:%s", feed_hash, phase_type)
         else:
             # Invalidate all templates for this feed
             count = 0
@@ -285,7 +328,7 @@ class TemplateCache:
                     cache.delete(key)
                     count += 1
             if count:
-                logger.info(f"Invalidated {count} template cache entries for feed {feed_hash}")
+                logger.info("Invalidated %s template cache entries for feed %s", count, feed_hash)
 
     def clear(self):
         """Clear all template cache entries."""
@@ -295,7 +338,7 @@ class TemplateCache:
             if isinstance(key, str) and key.startswith(self.CACHE_PREFIX):
                 cache.delete(key)
                 count += 1
-        logger.info(f"Cleared {count} template cache entries")
+        logger.info("Cleared %s template cache entries", count)
 
     def get_stats(self) -> dict:
         """Get template cache statistics."""
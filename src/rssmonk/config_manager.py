@@ -33,7 +33,7 @@ class FeedConfigManager:
             }
 
         new_feed = self.rss_monk.add_feed(url, email_base_url, new_frequency, new_name)
-        logger.info(f"Created new feed configuration: {new_feed.name}")
+        logger.info("Created new feed configuration: %s", new_feed.name)
 
         return {
             "action": "updated",
@@ -82,7 +82,7 @@ class FeedConfigManager:
                 configurations.append(feed_dict)
 
             except Exception as e:
-                logger.error(f"Failed to get subscriber count for {feed.name}: {e}")
+                logger.error("Failed to get subscriber count for %s: %s", feed.name, e)
                 configurations.append(self._feed_to_dict(feed))
 
         return {"url": url, "configurations": configurations, "total_configurations": len(configurations)}
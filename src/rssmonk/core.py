@@ -1,26 +1,33 @@
 """Core models and service for RSS Monk."""
 
 import asyncio
+import feedparser
 import httpx
 import uuid
 
+from collections import defaultdict
 from http import HTTPStatus
 from fastapi import HTTPException
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Collection, Optional, Tuple
 
 from fastapi.security import HTTPBasicCredentials
 
-from rssmonk.models import EmailTemplate, Feed, Frequency, ListVisibilityType, Subscriber
+from rssmonk.models import EmailTemplate, Feed, Frequency, ListmonkTemplate, ListVisibilityType, Subscriber
 from rssmonk.utils import (
+    bitmap_indices,
+    build_identifier_bitmaps,
     expand_filter_identifiers,
+    make_filter_key,
     make_filter_url,
     make_list_role_name,
     make_template_name,
     make_url_hash,
     make_url_tag_from_hash,
-    matches_filter,
+    match_bitmap,
     numberfy_subbed_lists,
+    split_filter_identifiers,
 )
 from rssmonk.types import (
     AVAILABLE_FREQUENCY_SETTINGS,
@@ -41,6 +48,27 @@ from .shared import Settings
 
 logger = get_logger(__name__)
 
+# Read-only default for attribs lookups, saves building an empty dict per subscriber. Never mutate.
+_EMPTY: dict = {}
+
+# Number of most recent article GUIDs kept in a feed's tags to detect new articles
+_SEEN_GUIDS_KEPT = 10
+
+# The frequency settings are fixed, so they are built once rather than for every feed checked
+_FREQUENCY_SETTINGS = AVAILABLE_FREQUENCY_SETTINGS()
+
+# Digest template used for each frequency's notifications
+_DIGEST_TYPES = {Frequency.INSTANT: EmailPhaseType.INSTANT_DIGEST, Frequency.DAILY: EmailPhaseType.DAILY_DIGEST}
+
+# Name of the RSSMonk method process_feed runs for each frequency's emails, looked up on the instance
+_EMAIL_CHECKS = {Frequency.INSTANT: "perform_instant_email_check", Frequency.DAILY: "perform_daily_email_check"}
+
+
+@lru_cache(maxsize=1024)
+def _parse_poll_time(iso: str) -> datetime:
+    """Parse a last-process timestamp. A tag only changes when its feed is polled, so most checks reuse the parse."""
+    return datetime.fromisoformat(iso)
+
 
 class RSSMonk:
     """Main RSS Monk service - stateless, uses Listmonk for persistence. Should be used with"""
@@ -63,6 +91,8 @@ class RSSMonk:
             auth_type=AuthType.BASIC,
             timeout=self.settings.rss_timeout,
         )
+        # Feed lists fetched during this request, so a processing pass reads each list once
+        self._tag_index_cache: dict[int, dict] = {}
 
     # Create two clients, local creds for access control and admin creds for use if required
     def __enter__(self):
@@ -235,7 +265,7 @@ class RSSMonk:
             try:
                 self._client.delete(f"/api/roles/{role_id}")
             except Exception:
-                logger.error(f"Failed to delete list role {role_id}")
+                logger.error("Failed to delete list role %s", role_id)
         return True
 
     # Feed operations
@@ -270,17 +300,17 @@ class RSSMonk:
             return feed
         else:
             # No update required if the URL and frequencies are already covered
-            if set(new_frequency) <= set(existing_feed.poll_frequencies):
+            existing_frequencies = set(existing_feed.poll_frequencies)
+            if existing_frequencies.issuperset(new_frequency):
                 raise HTTPException(
                     status_code=HTTPStatus.CONFLICT,
                     detail=f"Feed with same URL and frequency combination already exists: {feed_url}",
                 )
 
-            # Add new freq tags to end of the list and update
-            for new_freq in new_frequency:
-                if f"freq:{new_freq.value}" not in existing_feed.tags:
-                    existing_feed.poll_frequencies.append(new_freq)
-                    existing_feed.tags.append(f"freq:{new_freq.value}")
+            # Add new freqs to end of the list and update. Feed.tags is derived from poll_frequencies
+            existing_feed.poll_frequencies.extend(
+                new_freq for new_freq in dict.fromkeys(new_frequency) if new_freq not in existing_frequencies
+            )
 
             payload = {
                 "name": existing_feed.name,
@@ -288,21 +318,23 @@ class RSSMonk:
                 "tags": existing_feed.tags,
             }
             self._client.update_list_data(existing_feed.id, payload)
+            self._tag_index_cache.pop(existing_feed.id, None)  # Tags have changed
             return existing_feed
 
     def list_feeds(self, freq: Optional[Frequency] = None) -> list[Feed]:
         """list all feeds. Optional freq to list all feeds by freq type"""
-        feeds = []
+        feeds: dict[int, Feed] = {}  # Deduplicated by ID as they're parsed
         lists = self._client.get_lists(tag=f"freq:{freq.value}" if freq is not None else None)
         for lst in lists:
+            if not lst.get("id") or lst["id"] in feeds:
+                continue
             try:
                 feed = self._parse_feed_from_list(lst)
-                feeds.append(feed)
+                feeds[feed.id] = feed
             except Exception as e:
-                logger.warning(f"Could not parse feed. Skipping {lst.get('name')}: {e}")
+                logger.warning("Could not parse feed. Skipping %s: %s", lst.get("name"), e)
 
-        # Deduplicate by ID
-        return list({f.id: f for f in feeds if f.id}.values())
+        return list(feeds.values())
 
     def get_feed_by_url(self, url: str) -> Optional[Feed]:
         """Get feed by URL."""
@@ -330,8 +362,6 @@ class RSSMonk:
         # Check cache first
         cached = template_cache.get(feed_hash, cache_key_suffix)
         if cached:
-            from rssmonk.http_clients import ListmonkTemplate
-
             return ListmonkTemplate(**cached)
 
         # Fetch from Listmonk
@@ -348,8 +378,6 @@ class RSSMonk:
         # Check cache first
         cached = template_cache.get(feed_hash, cache_key_suffix)
         if cached:
-            from rssmonk.http_clients import ListmonkTemplate
-
             return ListmonkTemplate(**cached)
 
         # Fetch from Listmonk
@@ -404,36 +432,32 @@ class RSSMonk:
 
     def get_subscriber_feed_filter(self, email: str) -> Optional[dict]:
         """Get existing subscriber's data block."""
-        subs = self._admin.get_subscribers(query=f"subscribers.email='{email}'")
-        if subs:
-            s = subs[0]
-            return s["attribs"]
-        return None
+        subs = self._admin.get_subscriber_by_email(email)
+        return subs["attribs"] if subs else None
 
     def get_subscriber_by_uuid(self, uuid: str) -> Optional[dict]:
         """Get existing subscriber's data block."""
-        subs = self._admin.get_subscribers(query=f"subscribers.uuid = '{uuid}'")
-        if subs:
-            s = subs[0]
-            return s["uuid"]
-        return None
+        subs = self._admin.find_subscriber("uuid", uuid)
+        return subs["uuid"] if subs else None
 
-    def get_subscriber_uuid(self, email: str) -> str:
-        """Get existing subscriber's data block."""
-        subs = self._admin.get_subscribers(query=f"subscribers.email='{email}'")
+    def get_subscriber(self, email: str) -> dict:
+        """Get existing subscriber's full record, which can be passed on to avoid fetching it again."""
+        subs = self._admin.get_subscriber_by_email(email)
         if subs:
-            s = subs[0]
-            return s["uuid"]
+            return subs
 
         logger.error("Subscriber (%s) is missing uuid", email)
         raise HTTPException(status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail="")
 
+    def get_subscriber_uuid(self, email: str) -> str:
+        """Get existing subscriber's data block."""
+        return self.get_subscriber(email)["uuid"]
+
     def get_or_create_subscriber(self, email: str) -> Subscriber:
         """Get existing or create new subscriber."""
-        subs = self._admin.get_subscribers(query=f"subscribers.email='{email}'")
+        subs = self._admin.get_subscriber_by_email(email)
         if subs:
-            s = subs[0]
-            return Subscriber(id=s["id"], email=s["email"])  # Listmonk will populate name from the email
+            return Subscriber(id=subs["id"], email=subs["email"])  # Listmonk will populate name from the email
         return self.add_subscriber(email)
 
     def list_subscribers(self) -> list[Subscriber]:
@@ -463,12 +487,19 @@ class RSSMonk:
         return True
 
     def update_subscriber_filter(
-        self, email: str, sub_filter: dict, feed_hash: str, bypass_confirmation: bool = False
+        self,
+        email: str,
+        sub_filter: dict,
+        feed_hash: str,
+        bypass_confirmation: bool = False,
+        subscriber: Optional[dict] = None,
     ) -> Optional[str]:
-        """Adds either a pending filter, or main filter. Returns uuid of the pending filter if confirmation is required"""
+        """Adds either a pending filter, or main filter. Returns uuid of the pending filter if confirmation is required
+
+        A subscriber record the caller already fetched (after any list changes) can be passed to skip the lookup.
+        """
         feed = self.get_feed_by_hash(feed_hash)
-        sub_list = self._admin.get_subscribers(query=f"subscribers.email='{email}'")
-        subs: dict = sub_list[0] if sub_list is not None else None
+        subs = subscriber if subscriber is not None else self._admin.get_subscriber_by_email(email)
 
         if not feed or not feed.id:
             raise ValueError(f"Feed not found: {feed_hash}")
@@ -513,12 +544,19 @@ class RSSMonk:
 
     def remove_subscriber_filter(self, email: str, feed_hash: str):
         """Removes the feed hash from the attribs"""
-        sub_list = self._admin.get_subscribers(query=f"subscribers.email='{email}'")
-        subs: dict = sub_list[0] if sub_list is not None else None
-
+        subs = self._admin.get_subscriber_by_email(email)
         if not subs:
             return  # Count as removed
 
+        self._remove_feed_from_subscriber(subs, feed_hash)
+
+    def remove_subscribers_filter(self, emails: list[str], feed_hash: str):
+        """Removes the feed hash from the attribs of many subscribers, looking them up in batches"""
+        for subs in self._admin.get_subscribers_by_emails(emails):
+            self._remove_feed_from_subscriber(subs, feed_hash)
+
+    def _remove_feed_from_subscriber(self, subs: dict, feed_hash: str):
+        """Drops the feed hash from a fetched subscriber, deleting them if they have no lists left"""
         # Attribs format
         # attribs
         # - url_hash
@@ -583,42 +621,47 @@ class RSSMonk:
                 url=feed.feed_url, user_agent=self.settings.rss_user_agent, timeout=self.settings.rss_timeout
             )
             # Get the template with the frequency
-            digest_type = EmailPhaseType.INSTANT_DIGEST
-            if frequency == Frequency.DAILY:
-                digest_type = EmailPhaseType.DAILY_DIGEST
-            template = self.get_template(feed.url_hash, digest_type)
+            # Listmonk renders the email, so only the template's id is needed here
+            # The Listmonk client is synchronous, so its calls run in a worker thread to let other feeds proceed
+            template = await asyncio.to_thread(self.get_template_metadata, feed.url_hash, _DIGEST_TYPES[frequency])
             if not template:
                 raise HTTPException(
                     status_code=HTTPStatus.UNPROCESSABLE_CONTENT,
                     detail=f"Template does not exist for {frequency.value}",
                 )
 
-            # Get new articles (check against last poll tag)
-            new_articles = self._find_new_articles(feed, articles)
+            # Get new articles (check against the last-guid tags)
+            seen_guids = await asyncio.to_thread(self._get_seen_guids, feed.id)
+            new_articles = self._find_new_articles(seen_guids, articles)
 
             if not new_articles:
-                self._update_poll_time(feed, frequency)
+                await asyncio.to_thread(self._update_poll_time, feed, frequency)
                 return 0, 0  # No need to send out anything
 
             # Instant and Daily vary enough to have two functions to handle the processing
-            subscribers = self.get_client().get_all_feed_subscribers(feed.id)
-            if frequency == Frequency.INSTANT:
-                notifications_sent += self.perform_instant_email_check(
-                    feed, frequency, template.id, new_articles, subscribers
-                )
-            else:
-                notifications_sent += self.perform_daily_email_check(
-                    feed, frequency, template.id, new_articles, subscribers
-                )
+            subscribers = await asyncio.to_thread(self.get_client().get_all_feed_subscribers, feed.id)
+            email_check = getattr(self, _EMAIL_CHECKS[frequency])
+            notifications_sent += await asyncio.to_thread(
+                email_check, feed, frequency, template.id, new_articles, subscribers
+            )
 
             # Update state
-            self._update_feed_state(feed, frequency, new_articles)
+            await asyncio.to_thread(self._update_feed_state, feed, frequency, new_articles)
             return notifications_sent, len(new_articles)
 
         except Exception as e:
-            logger.exception(f"Feed processing failed for {feed.name}: {e}")
+            logger.exception("Feed processing failed for %s: %s", feed.name, e)
             return 0, 0
 
+    @staticmethod
+    def _get_subscriber_filter(subscriber: dict, feed_hash: str, frequency: Frequency) -> dict | str:
+        """Read a subscriber's filter for a feed and frequency, an empty string when there is none.
+
+        Walks the attribs in place, with missing or null levels read from a shared empty dict.
+        """
+        feed_hash_data = (subscriber.get("attribs") or _EMPTY).get(feed_hash) or _EMPTY
+        return (feed_hash_data.get("filter") or _EMPTY).get(frequency.value, "")
+
     def perform_instant_email_check(
         self,
         feed: Feed,
@@ -632,34 +675,39 @@ class RSSMonk:
 
         Returns the number of notifications (by email count) sent
         """
-        # Each article will have it's own list of emails that will be emailed out as separate items
+        # Each article will have it's own list of emails that will be emailed out as separate items.
+        # Subscribers wanting every article are kept once, rather than appended to every article's list.
+        all_articles_recipients: list[str] = []
         feed_list_individual_articles: list[list[str]] = [[] for _ in range(len(new_articles))]
 
-        article_identifiers_list: list[set[str]] = []
-        for article in new_articles:
-            article_identifiers_list.append({x.strip() for x in article.filter_identifiers.split(",")})
+        article_identifiers_list = [split_filter_identifiers(article.filter_identifiers) for article in new_articles]
+        # Invert the identifiers so a filter is matched against every article with a few integer ORs
+        identifier_bitmaps = build_identifier_bitmaps(article_identifiers_list)
+
+        # Subscribers often share a filter, so each distinct filter is expanded and matched only once
+        matched_by_filter: dict[tuple, tuple[int, ...]] = {}
 
         for subscriber in subscribers:
             subscriber_email = subscriber["email"]
             # If ask for all, then add to all_inclusive_email_list
-            feed_hash_data: dict = dict(subscriber["attribs"]).get(feed.url_hash, {})
-            filter_freq_data = dict(feed_hash_data.get("filter", {})).get(
-                frequency.value, ""
-            )  # Empty string will be discarded
+            filter_freq_data = self._get_subscriber_filter(subscriber, feed.url_hash, frequency)
 
             if isinstance(filter_freq_data, str) and filter_freq_data == "all":
-                for i in range(len(new_articles)):  # Add to all article lists
-                    feed_list_individual_articles[i].append(subscriber_email)
+                all_articles_recipients.append(subscriber_email)
             elif isinstance(filter_freq_data, dict):
-                # Create expanded list of filter identifiers
-                categories_list, individual_topics_list = expand_filter_identifiers(filter_freq_data)
-                logger.debug("expanded_subscriber_filter: %s", individual_topics_list)
-                logger.debug("all_in_filter_list: %s", categories_list)
-
-                for index, article in enumerate(new_articles):
+                filter_key = make_filter_key(filter_freq_data)
+                matched = matched_by_filter.get(filter_key)
+                if matched is None:
+                    # Create expanded list of filter identifiers
+                    categories_list, individual_topics_list = expand_filter_identifiers(filter_freq_data)
+                    logger.debug("expanded_subscriber_filter: %s", individual_topics_list)
+                    logger.debug("all_in_filter_list: %s", categories_list)
                     # Match subscriber's preferences to the article's identifiers
-                    if matches_filter(categories_list, individual_topics_list, article_identifiers_list[index]):
-                        feed_list_individual_articles[index].append(subscriber_email)
+                    matched = bitmap_indices(match_bitmap(categories_list, individual_topics_list, identifier_bitmaps))
+                    matched_by_filter[filter_key] = matched
+
+                for index in matched:
+                    feed_list_individual_articles[index].append(subscriber_email)
             else:
                 # This should never trigger
                 logger.warning(
@@ -668,27 +716,24 @@ class RSSMonk:
 
         # Send out multiple emails for each new article to those who request it
         notifications_sent = 0
-        for index, article in enumerate(new_articles):
+        base_url = feed.email_base_url
+        for article, filtered_recipients in zip(new_articles, feed_list_individual_articles):
             # Send the email to all subscribers who wanted it
-            if feed_list_individual_articles[index]:
+            recipients = all_articles_recipients + filtered_recipients
+            if recipients:
                 data = {
                     "item": {
                         "title": article.title,
                         "link": article.link,
                         "description": article.description.replace("\n", "<br />"),
                     },
-                    "base_url": feed.email_base_url,
+                    "base_url": base_url,
                 }
-                logger.debug("feed_list_individual_items: %s", feed_list_individual_articles[index])
+                logger.debug("feed_list_individual_items: %s", recipients)
                 self._admin.send_transactional(
-                    NO_REPLY_EMAIL,
-                    template_id,
-                    "html",
-                    feed_list_individual_articles[index],
-                    data,
-                    new_articles[index].email_subject_line,
+                    NO_REPLY_EMAIL, template_id, "html", recipients, data, article.email_subject_line
                 )
-                notifications_sent += len(feed_list_individual_articles[index])
+                notifications_sent += len(recipients)
         return notifications_sent
 
     def perform_daily_email_check(
@@ -702,106 +747,112 @@ class RSSMonk:
         """
         Sends daily email notifications for new articles based on subscriber filters.
 
+        Subscribers who match the same set of articles receive the same email, so one transactional
+        send is made per distinct set with all of those subscribers as recipients.
+
         Returns the number of notifications (by email count) sent.
         """
-        # List of emails that are will get all updates in the feed.
-        # Each item will have it's own list of emails as separate items
-        users_full_items_list: list[str] = []
-        notifications_sent = 0
+        # Emails grouped by the indices of the articles they will receive, in article order
+        recipients_by_articles: defaultdict[tuple[int, ...], list[str]] = defaultdict(list)
+        all_articles = tuple(range(len(new_articles)))
 
-        article_identifiers_list: list[set[str]] = []
-        for article in new_articles:
-            article_identifiers_list.append({x.strip() for x in article.filter_identifiers.split(",")})
+        article_identifiers_list = [split_filter_identifiers(article.filter_identifiers) for article in new_articles]
+        # Invert the identifiers so a filter is matched against every article with a few integer ORs
+        identifier_bitmaps = build_identifier_bitmaps(article_identifiers_list)
+
+        # Subscribers often share a filter, so each distinct filter is expanded and matched only once
+        matched_by_filter: dict[tuple, tuple[int, ...]] = {}
 
         for subscriber in subscribers:
             sub_email = subscriber["email"]
-            # If ask for all, then add to all_inclusive_email_list
-            feed_hash_data: dict = dict(subscriber["attribs"]).get(feed.url_hash, {})
-            filter_freq_data = dict(feed_hash_data.get("filter", {})).get(
-                frequency.value, ""
-            )  # Empty string will be discarded
+            filter_freq_data = self._get_subscriber_filter(subscriber, feed.url_hash, frequency)
 
             # Scenarios
-            # 1. filter says all - add to feed_list_all_items
-            # 2. Make the items list for the user's tastes and email
+            # 1. filter says all - group with everyone receiving every article
+            # 2. Match the articles to the user's tastes and group with those receiving the same ones
             if isinstance(filter_freq_data, str) and filter_freq_data == "all":
-                users_full_items_list.append(sub_email)
-            else:
-                feed_items_to_send_out: list[FeedItem] = []
-                # Create expanded list of filter identifiers
-                categories_list, individual_topics_list = expand_filter_identifiers(filter_freq_data)
-
-                for index, article in enumerate(new_articles):
-                    # Go through the individual articles that are requested and match it to the user's preferences
-                    if matches_filter(categories_list, individual_topics_list, article_identifiers_list[index]):
-                        feed_items_to_send_out.append(article)
-
-                # Send transaction
-                if feed_items_to_send_out:
-                    data = {
-                        "items": [
-                            {
-                                "title": article.title,
-                                "link": article.link,
-                                "description": article.description.replace("\n", "<br />"),
-                            }
-                            for article in feed_items_to_send_out
-                        ],
-                        "base_url": feed.email_base_url,
-                    }
-                    self._admin.send_transactional(NO_REPLY_EMAIL, template_id, "html", [subscriber["email"]], data)
-                    notifications_sent += 1
-
-        # Send the email to all subscribers who wanted it
-        if users_full_items_list:
+                recipients_by_articles[all_articles].append(sub_email)
+            elif isinstance(filter_freq_data, dict):
+                filter_key = make_filter_key(filter_freq_data)
+                matched = matched_by_filter.get(filter_key)
+                if matched is None:
+                    # Create expanded list of filter identifiers
+                    categories_list, individual_topics_list = expand_filter_identifiers(filter_freq_data)
+                    matched = bitmap_indices(match_bitmap(categories_list, individual_topics_list, identifier_bitmaps))
+                    matched_by_filter[filter_key] = matched
+
+                if matched:
+                    recipients_by_articles[matched].append(sub_email)
+
+        # Send one email per group of subscribers who receive the same articles.
+        # Each article's item is built once and shared by every group that receives it.
+        all_items = [
+            {
+                "title": article.title,
+                "link": article.link,
+                "description": article.description.replace("\n", "<br />"),
+            }
+            for article in new_articles
+        ]
+        notifications_sent = 0
+        base_url = feed.email_base_url
+        for matched, recipients in recipients_by_articles.items():
             data = {
-                "items": [
-                    {
-                        "title": article.title,
-                        "link": article.link,
-                        "description": article.description.replace("\n", "<br />"),
-                    }
-                    for article in new_articles
-                ],
-                "base_url": feed.email_base_url,
+                "items": all_items if matched == all_articles else [all_items[index] for index in matched],
+                "base_url": base_url,
             }
-            self._admin.send_transactional(NO_REPLY_EMAIL, template_id, "html", users_full_items_list, data)
-            notifications_sent += len(users_full_items_list)
+            self._admin.send_transactional(NO_REPLY_EMAIL, template_id, "html", recipients, data)
+            notifications_sent += len(recipients)
         return notifications_sent
 
     async def process_feeds_by_frequency(self, frequency: Frequency) -> dict:
         """Process all feeds of given frequency that are due.
 
-        Feeds are processed in parallel using asyncio.TaskGroup for better performance.
+        Feeds are processed in parallel using asyncio.gather for better performance,
+        capped at settings.feed_concurrency so Listmonk isn't flooded when many feeds are due.
+        A failing feed is logged and counted as zero without cancelling the others.
+        Blocking Listmonk calls run in worker threads so feeds overlap their network waits.
         """
-        feeds = [f for f in self.list_feeds() if frequency in f.poll_frequencies]
-        feeds_to_process = [(feed, frequency) for feed in feeds if self._should_poll(frequency, feed)]
+
+        def due_feeds() -> list[tuple[Feed, Frequency]]:
+            now = datetime.now()
+            # Listmonk filters the lists by their freq tag, so only this frequency's feeds are fetched and parsed
+            feeds = [f for f in self.list_feeds(frequency) if frequency in f.poll_frequencies]
+            return [(feed, frequency) for feed in feeds if self._should_poll(frequency, feed, now)]
+
+        # Listmonk calls are blocking, so keep them off the event loop
+        feeds_to_process = await asyncio.to_thread(due_feeds)
 
         if not feeds_to_process:
             return {}
 
         results: dict[str, int] = {}
         errors: dict[str, str] = {}
+        limit = asyncio.Semaphore(self.settings.feed_concurrency)
 
         async def process_single_feed(feed: Feed, freq: Frequency) -> tuple[str, int, int]:
             """Process a single feed and return (name, notifications_sent, articles_found)."""
-            logger.info("Processing %s %s", freq.value, feed.name)
-            notifications_sent, articles_found = await self.process_feed(feed, freq)
+            async with limit:
+                logger.info("Processing %s %s", freq.value, feed.name)
+                notifications_sent, articles_found = await self.process_feed(feed, freq)
             return feed.name, notifications_sent, articles_found
 
         # Process feeds in parallel
-        async with asyncio.TaskGroup() as tg:
-            tasks = {feed.name: tg.create_task(process_single_feed(feed, freq)) for feed, freq in feeds_to_process}
+        outcomes = await asyncio.gather(
+            *(process_single_feed(feed, freq) for feed, freq in feeds_to_process), return_exceptions=True
+        )
 
-        # Collect results from completed tasks
-        for name, task in tasks.items():
-            try:
-                _, notifications_sent, _ = task.result()
-                results[name] = notifications_sent
-            except Exception as e:
-                logger.error("Failed to process feed %s: %s", name, e)
-                errors[name] = str(e)
-                results[name] = 0
+        # Collect results, in the same order as feeds_to_process
+        for (feed, _), outcome in zip(feeds_to_process, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("Failed to process feed %s: %s", feed.name, outcome)
+                errors[feed.name] = str(outcome)
+                results[feed.name] = 0
+            elif isinstance(outcome, BaseException):
+                raise outcome  # Cancellation and interpreter exits are not per-feed failures
+            else:
+                _, notifications_sent, _ = outcome
+                results[feed.name] = notifications_sent
 
         if errors:
             logger.warning("Feed processing completed with %d errors: %s", len(errors), list(errors.keys()))
@@ -811,27 +862,36 @@ class RSSMonk:
     # Helper methods
 
     def _get_feed_name(self, url: str) -> str:
-        """Get feed name from URL if one can be found, or the URL."""
-        try:
-            import feedparser
+        """Get feed name from URL if one can be found, or the URL.
 
-            feed = feedparser.parse(url)
-            return feed.get("title", url)
+        A title already held by the feed cache is reused instead of downloading the feed again.
+        """
+        cached_title = feed_cache.get_cached_title(url)
+        if cached_title:
+            return cached_title
+        try:
+            response = httpx.get(
+                url, headers={"User-Agent": self.settings.rss_user_agent}, timeout=self.settings.rss_timeout
+            )
+            response.raise_for_status()
+            return feedparser.parse(response.content).feed.get("title") or url
         except Exception:
             return url
 
     def _parse_feed_from_list(self, data: dict) -> Feed:
         """Parse feed from Listmonk list."""
-        tags = data.get("tags", [])
+        # Index the tags once; the list's state tags are then at hand for polling without fetching it again
+        index = self._index_tags(data.get("tags", []))
+        if data.get("id"):
+            self._tag_index_cache[data["id"]] = index  # A fresher read replaces any older copy
 
         # Extract frequencies
         frequency_list: list[Frequency] = []
-        for tag in tags:
-            if tag.startswith("freq:"):
-                try:
-                    frequency_list.append(Frequency(tag.replace("freq:", "")))
-                except ValueError:
-                    logger.error(f"Invalid frequency in tag {tag} for list ID {data.get('id'), 'unknown'}")
+        for freq in index["freqs"]:
+            try:
+                frequency_list.append(Frequency(freq))
+            except ValueError:
+                logger.error("Invalid frequency in tag freq:%s for list ID %s", freq, data.get("id", "unknown"))
         if len(frequency_list) == 0:
             raise ValueError("No frequency tag found in existing list")
 
@@ -843,9 +903,9 @@ class RSSMonk:
 
         for line in desc.split("\n"):
             if line.startswith(LIST_DESC_FEED_URL):
-                url = line.replace(LIST_DESC_FEED_URL, "").strip()
+                url = line.removeprefix(LIST_DESC_FEED_URL).strip()
             if line.startswith(SUB_BASE_URL):
-                sub_url = line.replace(SUB_BASE_URL, "").strip()
+                sub_url = line.removeprefix(SUB_BASE_URL).strip()
 
             if url and sub_url:
                 break
@@ -865,57 +925,83 @@ class RSSMonk:
             mult_freq=mult_freq,
         )
 
-    def _find_new_articles(self, feed: Feed, articles: list[FeedItem]) -> list[FeedItem]:
-        """Find new articles since last poll."""
-        if not articles:
-            return []
+    @staticmethod
+    def _index_tags(tags: list[str]) -> dict:
+        """Sort a list's tags by kind in one pass, so each state lookup doesn't rescan them.
 
-        # Get last seen GUID from tags
-        lst = self._client.get(f"/api/lists/{feed.id}")
-        tags = lst.get("tags", [])
-
-        last_guid = None
+        Returns {"freqs": [freq, ...], "last_process": {freq: iso}, "last_guid": {freq: [guid, ...]},
+        "other": [tag, ...]}.
+        """
+        index: dict = {"freqs": [], "last_process": {}, "last_guid": {}, "other": []}
         for tag in tags:
-            if str(tag).startswith("last-guid:"):
-                # Use split with maxsplit=2 to preserve colons in GUID (e.g., URN format)
-                last_guid = str(tag).split(":", 2)[2]
-                break
-
-        if not last_guid:
+            tag = str(tag)
+            kind, _, value = tag.partition(":")
+            if kind == "freq":
+                index["freqs"].append(value)
+            elif kind == "last-process":
+                # Partition once more so colons in ISO timestamps are preserved
+                freq, _, iso = value.partition(":")
+                index["last_process"].setdefault(freq, iso)
+            elif kind == "last-guid":
+                # Partition once more so colons in GUIDs (e.g., URN format) are preserved
+                freq, _, guid = value.partition(":")
+                index["last_guid"].setdefault(freq, []).append(guid)
+            else:
+                index["other"].append(tag)
+        return index
+
+    def _get_tag_index(self, list_id: int) -> dict:
+        """Get a feed's indexed list tags, reusing the copy already fetched in this request."""
+        index = self._tag_index_cache.get(list_id)
+        if index is None:
+            lst = self._client.get(f"/api/lists/{list_id}")
+            index = self._tag_index_cache[list_id] = self._index_tags(lst.get("tags", []))
+        return index
+
+    def _get_seen_guids(self, list_id: int) -> set[str]:
+        """Get the recently seen article GUIDs from a feed's tags, one window is kept across the frequencies."""
+        return {guid for guids in self._get_tag_index(list_id)["last_guid"].values() for guid in guids}
+
+    @staticmethod
+    def _find_new_articles(seen_guids: Collection[str], articles: list[FeedItem]) -> list[FeedItem]:
+        """Find new articles since last poll.
+
+        Keeping several seen GUIDs means a removed or edited article doesn't cause the whole feed to be sent again.
+        """
+        if not seen_guids:
             return articles
 
-        # Find new articles (those before last seen in chronological order)
+        # Find new articles (those before the first seen in chronological order)
         for i, article in enumerate(articles):
             article_id = article.guid or article.link
-            if article_id == last_guid:
-                return articles[:i]  # Slice it up to the last guid
+            if article_id in seen_guids:
+                return articles[:i]  # Slice it up to the first seen guid
 
         return articles
 
-    def _should_poll(self, current_frequency: Frequency, feed: Feed) -> bool:
+    def _should_poll(self, current_frequency: Frequency, feed: Feed, now: Optional[datetime] = None) -> bool:
         """Determine if a feed should be polled based on frequency settings.
 
         For instant: Poll if more than interval_minutes have passed since last poll.
         For daily: Poll if it's past check_time AND we haven't polled today yet.
+        The caller can pass now so every feed in one processing pass is judged against the same time.
         """
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
+        freq_value = current_frequency.value
 
-        config = AVAILABLE_FREQUENCY_SETTINGS().get(f"freq:{current_frequency.value}")
+        config = _FREQUENCY_SETTINGS.get(f"freq:{freq_value}")
         if not config:
             return False
 
         # Get last poll time from tags
-        lst = self._client.get(f"/api/lists/{feed.id}")
-        tags = lst.get("tags", [])
-
         last_poll = None
-        for tag in tags:
-            if str(tag).startswith(f"last-process:{current_frequency.value}:"):
-                try:
-                    # Use split with maxsplit=2 to preserve colons in ISO timestamp
-                    last_poll = datetime.fromisoformat(tag.split(":", 2)[2])
-                except (ValueError, IndexError):
-                    continue
+        last_process = self._get_tag_index(feed.id)["last_process"].get(freq_value)
+        if last_process:
+            try:
+                last_poll = _parse_poll_time(last_process)
+            except ValueError:
+                pass  # Treated as never polled
 
         # If no last_poll data, allow polling immediately to get the data into the list
         if not last_poll:
@@ -927,20 +1013,14 @@ class RSSMonk:
 
         # Time-based check (daily frequency)
         if config.get("check_time"):
-            target_hour, target_minute = config["check_time"]
-            target_time = now.replace(hour=target_hour, minute=target_minute, second=0, microsecond=0)
+            # Compare (hour, minute) tuples rather than building target datetimes on every check
+            target = tuple(config["check_time"])
 
             # Check if we've already polled today (after today's target time)
-            today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            already_polled_today = last_poll >= today_start and last_poll >= target_time.replace(
-                year=last_poll.year, month=last_poll.month, day=last_poll.day
-            )
+            already_polled_today = last_poll.date() >= now.date() and (last_poll.hour, last_poll.minute) >= target
 
             # Poll if it's past target time AND we haven't polled today
-            if now >= target_time and not already_polled_today:
-                return True
-
-            return False
+            return (now.hour, now.minute) >= target and not already_polled_today
 
         return False
 
@@ -949,34 +1029,47 @@ class RSSMonk:
         self._update_feed_state(feed, frequency, [])
 
     def _update_feed_state(self, feed: Feed, frequency: Frequency, articles: list[FeedItem]):
-        """Update feed state in Listmonk tags."""
+        """Update feed state in Listmonk tags.
+
+        The list is read again just before writing, so state written by another frequency's run since this pass
+        first read the list is kept rather than overwritten with the older copy.
+        """
         lst = self._client.get(f"/api/lists/{feed.id}")
-        tags = lst.get("tags", [])
+        index = self._index_tags(lst.get("tags", []))
+        freq_value = frequency.value
 
         # Replace last-process tag
         now = datetime.now()
-        tags = [t for t in tags if not str(t).startswith(f"last-process:{frequency.value}:")]
-        tags.append(f"last-process:{frequency.value}:{now.isoformat()}")
-
-        # Add latest GUID if we have articles
-        if articles and len(articles) > 0:
-            latest_guid = articles[0].guid or articles[0].link
-            # Replace last-guid tag
-            tags = [t for t in tags if not str(t).startswith("last-guid:")]
-            tags.append(f"last-guid:{frequency.value}:{latest_guid}")
+        last_process = {**index["last_process"], freq_value: now.isoformat()}
+
+        # Add the new GUIDs ahead of those already seen if we have articles, replacing the last-guid tags
+        last_guid = index["last_guid"]
+        if articles:
+            seen = [guid for guids in last_guid.values() for guid in guids]
+            guids = [article.guid or article.link for article in articles] + seen
+            last_guid = {freq_value: list(dict.fromkeys(guids))[:_SEEN_GUIDS_KEPT]}
+
+        # Rebuild the tags from the index, other tags are passed straight through
+        tags = (
+            index["other"]
+            + [f"freq:{freq}" for freq in index["freqs"]]
+            + [f"last-process:{freq}:{iso}" for freq, iso in last_process.items()]
+            + [f"last-guid:{freq}:{guid}" for freq, guids in last_guid.items() for guid in guids]
+        )
 
         # Update list
         self._client.put(
             f"/api/lists/{feed.id}",
             {"name": feed.name, "description": feed.description, "tags": tags},
         )
+        self._tag_index_cache.pop(feed.id, None)  # Tags have changed
 
     def _create_campaign(self, feed: Feed, article: FeedItem) -> int:
         """Create campaign for article."""
         title = article.title or "No title"
         link = article.link or ""
         description = article.description or ""
-        published = article.published.isoformat() if article.published else ""
+        published = article.published or ""
 
         # Create simple HTML content
         content = f"""
@@ -1005,7 +1098,7 @@ class RSSMonk:
         </div>
         """
 
-        campaign_name = f"RSS: {title[:50]}..." if len(title) > 50 else f"RSS: {title}"
+        campaign_name = f"RSS: {title[:50]}{'...' if len(title) > 50 else ''}"
 
         # Get first frequency for tagging
         freq_tag = feed.poll_frequencies[0].value if feed.poll_frequencies else "instant"
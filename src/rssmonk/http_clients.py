@@ -7,8 +7,6 @@ from fastapi import HTTPException
 from http import HTTPMethod, HTTPStatus
 import httpx
 
-import requests
-
 from rssmonk.models import EmailTemplate, ListmonkTemplate
 from rssmonk.utils import make_template_name
 from rssmonk.types import EmailPhaseType
@@ -28,6 +26,21 @@ class AuthType(StrEnum):
     SESSION = "session"
 
 
+class _SharedTransport(httpx.HTTPTransport):
+    """Connection pool shared by every ListmonkClient; closing a client leaves the pool open."""
+
+    def close(self) -> None:
+        pass
+
+
+# Every ListmonkClient talks to the same Listmonk host, so keep-alive connections are pooled process-wide.
+# Clients are still built per context with their own auth; only the transport outlives them.
+# Connection failures are retried at the transport so a poll cycle isn't lost to a dropped socket.
+_listmonk_transport = _SharedTransport(
+    retries=3, limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+)
+
+
 class ListmonkClient:
     """Listmonk API client with automatic JSON handling and error logging."""
 
@@ -45,11 +58,14 @@ class ListmonkClient:
             raise ValueError("Listmonk password is required")
 
         self._client = None
+        # Template ids by name, read once per client and dropped whenever this client changes a template
+        self._template_ids: Optional[dict[str, int]] = None
 
     def __enter__(self):
         if self.auth_type == AuthType.SESSION:
             self.cookies = self._init_listmonk_session()
 
+        # httpx already negotiates gzip; the shared transport provides keep-alive across clients
         self._client = httpx.Client(
             base_url=self.base_url,
             auth=httpx.BasicAuth(username=self.username, password=self.password)
@@ -58,6 +74,7 @@ class ListmonkClient:
             cookies=self.cookies if self.auth_type == AuthType.SESSION else None,
             timeout=self.timeout,
             headers={"Content-Type": "application/json"},
+            transport=_listmonk_transport,
         )
         return self
 
@@ -67,24 +84,26 @@ class ListmonkClient:
             self._client = None
 
     def _init_listmonk_session(self) -> dict:
-        session = requests.Session()
-        # Collect the nonce from the login page to satisfy CSRF protection
-        response = session.get(f"{self.base_url}/admin/login")
-        login_data = {
-            "username": self.username,
-            "password": self.password,
-            "nonce": session.cookies["nonce"],
-            "next": "/admin",
-        }
-
-        response = session.post(f"{self.base_url}/admin/login", data=login_data, allow_redirects=False, timeout=30)
-        if response.status_code == 302:
-            return {
+        # Log in over the shared transport so the login reuses, and leaves behind, a pooled connection.
+        # httpx doesn't follow redirects by default, so the login's 302 is returned as is.
+        with httpx.Client(base_url=self.base_url, timeout=self.timeout, transport=_listmonk_transport) as session:
+            # Collect the nonce from the login page to satisfy CSRF protection
+            session.get("/admin/login")
+            login_data = {
+                "username": self.username,
+                "password": self.password,
                 "nonce": session.cookies["nonce"],
-                "session": session.cookies["session"],
+                "next": "/admin",
             }
-        else:
-            raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED)
+
+            response = session.post("/admin/login", data=login_data)
+            if response.status_code == 302:
+                return {
+                    "nonce": session.cookies["nonce"],
+                    "session": session.cookies["session"],
+                }
+            else:
+                raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED)
 
     def _make_request(self, method: HTTPMethod, path: str, **kwargs: Any) -> ApiResponse:
         """Make HTTP request with error handling."""
@@ -170,6 +189,30 @@ class ListmonkClient:
         data = self.get("/api/subscribers", params=params)
         return self._normalize_results(data)
 
+    @staticmethod
+    def _sql_literal(value: str) -> str:
+        """Quote a value for a Listmonk subscriber query, which is a raw SQL expression."""
+        return "'" + str(value).replace("'", "''") + "'"
+
+    def find_subscriber(self, column: str, value: str) -> Optional[dict[str, Any]]:
+        """Find a single subscriber by an exact column match (e.g. email or uuid)."""
+        params = {"query": f"subscribers.{column}={self._sql_literal(value)}", "per_page": 1}
+        subs = self._normalize_results(self.get("/api/subscribers", params=params))
+        return subs[0] if subs else None
+
+    def get_subscriber_by_email(self, email: str) -> Optional[dict[str, Any]]:
+        """Find a single subscriber by email."""
+        return self.find_subscriber("email", email)
+
+    def get_subscribers_by_emails(self, emails: list[str], batch_size: int = 500) -> list[dict[str, Any]]:
+        """Get many subscribers by email, one query per batch rather than one per email."""
+        subscriber_list: list[dict[str, Any]] = []
+        for start in range(0, len(emails), batch_size):
+            quoted = ",".join(self._sql_literal(email) for email in emails[start : start + batch_size])
+            data = self.get("/api/subscribers", params={"query": f"subscribers.email IN ({quoted})", "per_page": "all"})
+            subscriber_list.extend(self._normalize_results(data))
+        return subscriber_list
+
     def get_all_feed_subscribers(self, feed_ident: int) -> list[dict[str, Any]]:
         """Fetch all pages and put into a list"""
         try:
@@ -284,36 +327,41 @@ class ListmonkClient:
         self, feed_hash: str, template_type: EmailPhaseType, meta_data_only: bool = False
     ) -> ListmonkTemplate | None:
         """Find a single email template."""
-        template_name = make_template_name(feed_hash, template_type)
-        templates_meta = self.get_templates(no_body=not meta_data_only)
-        for template_meta in templates_meta:
-            if template_meta["name"] == template_name:
-                template = self.get_template_by_id(template_meta["id"])
-                lmTemplate = ListmonkTemplate(
-                    id=template["id"],
-                    name=template["name"],
-                    subject=template["subject"],
-                    type=template["type"],
-                    body="",
-                    body_source=template["body_source"],
-                    is_default=template["is_default"],
-                )
-                if not meta_data_only:
-                    lmTemplate.body = template["body"]  # This is used for GET /api/feeds/templates
-                return lmTemplate
-        return None
+        if self._template_ids is None:
+            # Only names are needed to find the template, the body comes from get_template_by_id
+            self._template_ids = {t["name"]: t["id"] for t in self.get_templates(no_body=True)}
+        template_id = self._template_ids.get(make_template_name(feed_hash, template_type))
+        if template_id is None:
+            return None
+
+        template = self.get_template_by_id(template_id)
+        lmTemplate = ListmonkTemplate(
+            id=template["id"],
+            name=template["name"],
+            subject=template["subject"],
+            type=template["type"],
+            body="",
+            body_source=template["body_source"],
+            is_default=template["is_default"],
+        )
+        if not meta_data_only:
+            lmTemplate.body = template["body"]  # This is used for GET /api/feeds/templates
+        return lmTemplate
 
     def create_email_template(self, template: EmailTemplate):
         """Create the email template"""
         payload = {"name": template.name, "type": "tx", "subject": template.subject, "body": template.body}
+        self._template_ids = None
         return self.post("/api/templates", payload)
 
     def update_email_template(self, ident: int, template: EmailTemplate):
         """Update the email template"""
         payload = {"name": template.name, "type": "tx", "subject": template.subject, "body": template.body}
+        self._template_ids = None
         return self.put(f"/api/templates/{ident}", payload)
 
     def delete_email_template(self, template_id: int):
+        self._template_ids = None
         return self.delete(f"/api/templates/{template_id}")
 
     def send_transactional(
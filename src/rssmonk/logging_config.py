@@ -5,9 +5,17 @@ import logging.config
 import sys
 from typing import Optional
 
+# Arguments of the last applied configuration, so repeated setup calls don't rebuild every handler
+_applied: Optional[tuple[str, Optional[str]]] = None
+
 
 def setup_logging(level: str = "INFO", format_str: Optional[str] = None) -> None:
     """Setup structured logging configuration."""
+    global _applied
+    applied = (level, format_str)
+    if _applied == applied:
+        return
+
     if format_str is None:
         format_str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
@@ -45,6 +53,7 @@ def setup_logging(level: str = "INFO", format_str: Optional[str] = None) -> None
     }
 
     logging.config.dictConfig(config)
+    _applied = applied
 
 
 def get_logger(name: str) -> logging.Logger:
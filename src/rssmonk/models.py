@@ -1,10 +1,9 @@
 """Pydantic models for RSS Monk API."""
 
-import hashlib
 from typing import Any, Optional
 import uuid
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, Field, HttpUrl, field_validator, model_validator
 
 from rssmonk.types import (
     ALL_FILTER,
@@ -16,6 +15,7 @@ from rssmonk.types import (
     Frequency,
     ListVisibilityType,
 )
+from rssmonk.utils import make_url_hash
 
 
 class Feed(BaseModel):
@@ -31,10 +31,11 @@ class Feed(BaseModel):
     """This should be populated after getting the feed from the DB"""
     mult_freq: bool = False
 
-    def __init__(self, **data):
-        super().__init__(**data)
+    @model_validator(mode="after")
+    def default_url_hash(self):
         if not self.url_hash:
-            self.url_hash = hashlib.sha256(self.feed_url.encode()).hexdigest()
+            self.url_hash = make_url_hash(self.feed_url)
+        return self
 
     @property
     def tags(self) -> list[str]:
@@ -68,10 +69,11 @@ class Subscriber(BaseModel):
     name: str = ""
     attribs: Optional[dict] = None
 
-    def __init__(self, **data):
-        super().__init__(**data)
+    @model_validator(mode="after")
+    def default_name(self):
         if not self.name:
             self.name = self.email
+        return self
 
 
 class EmailTemplate(BaseModel):
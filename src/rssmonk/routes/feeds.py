@@ -69,15 +69,15 @@ async def create_feed(
                 url_hash=feed.url_hash,
             )
     except ValueError as e:
-        logger.error(f"ValueError in create_feed: {e}")
+        logger.error("ValueError in create_feed: %s", e)
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
     except httpx.HTTPStatusError as e:
         if e.response.status_code in (401, 403):
             raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED, detail="Invalid credentials")
-        logger.error(f"HTTP create_feed: {e}")
+        logger.error("HTTP create_feed: %s", e)
         raise
     except httpx.HTTPError as e:
-        logger.error(f"HTTP create_feed: {e}")
+        logger.error("HTTP create_feed: %s", e)
         raise
 
 
@@ -114,7 +114,7 @@ async def list_feeds(credentials: HTTPBasicCredentials = Depends(security)) -> F
     except Exception as e:
         if "401" in str(e) or "403" in str(e) or "Unauthorized" in str(e) or "Forbidden" in str(e):
             raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED, detail="Invalid credentials")
-        logger.error(f"Failed to list feeds: {e}")
+        logger.error("Failed to list feeds: %s", e)
         raise HTTPException(status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail="Failed to retrieve feeds")
 
 
@@ -149,7 +149,7 @@ async def get_feed_by_url(feed_url: str, credentials: HTTPBasicCredentials = Dep
     except Exception as e:
         if "401" in str(e) or "403" in str(e) or "Unauthorized" in str(e) or "Forbidden" in str(e):
             raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED, detail="Invalid credentials")
-        logger.error(f"Failed to get feed by URL: {e}")
+        logger.error("Failed to get feed by URL: %s", e)
         raise HTTPException(status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail="Failed to retrieve feed")
 
 
@@ -175,8 +175,7 @@ async def delete_feed_by_url(request: FeedDeleteRequest, credentials: HTTPBasicC
 
             if rss_monk.delete_feed(str(request.feed_url)):
                 feed_cache.invalidate_url(str(request.feed_url))
-                for subscriber in subscriber_list:
-                    rss_monk.remove_subscriber_filter(subscriber["email"], feed_hash)
+                rss_monk.remove_subscribers_filter([subscriber["email"] for subscriber in subscriber_list], feed_hash)
                 rss_monk.delete_list_role(str(request.feed_url))
                 rss_monk.delete_feed_templates(str(request.feed_url))
                 return {"message": "Feed deleted successfully"}
@@ -185,7 +184,7 @@ async def delete_feed_by_url(request: FeedDeleteRequest, credentials: HTTPBasicC
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to delete feed: {e}")
+        logger.error("Failed to delete feed: %s", e)
         raise HTTPException(status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail="Failed to delete feed")
 
 
@@ -200,7 +199,7 @@ async def get_url_configurations(feed_url: str, credentials: HTTPBasicCredential
             config_manager = FeedConfigManager(rss_monk)
             return config_manager.get_url_configurations(feed_url)
     except Exception as e:
-        logger.error(f"Failed to get URL configurations: {e}")
+        logger.error("Failed to get URL configurations: %s", e)
         raise HTTPException(status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail="Failed to retrieve configurations")
 
 
@@ -222,7 +221,7 @@ async def update_feed_configuration(request: FeedCreateRequest, credentials: HTT
     except ValueError as e:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
     except Exception as e:
-        logger.error(f"Failed to update feed configuration: {e}")
+        logger.error("Failed to update feed configuration: %s", e)
         raise HTTPException(status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail="Failed to update configuration")
 
 
@@ -265,10 +264,10 @@ async def create_template(
     except httpx.HTTPStatusError as e:
         if e.response.status_code in (401, 403):
             raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED, detail="Invalid credentials")
-        logger.error(f"HTTP create_template: {e}")
+        logger.error("HTTP create_template: %s", e)
         raise
     except httpx.HTTPError as e:
-        logger.error(f"HTTP create_template: {e}")
+        logger.error("HTTP create_template: %s", e)
         raise
 
 
@@ -303,10 +302,10 @@ async def delete_feed_template(
         except httpx.HTTPStatusError as e:
             if e.response.status_code in (401, 403):
                 raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED, detail="Invalid credentials")
-            logger.error(f"HTTP delete_template: {e}")
+            logger.error("HTTP delete_template: %s", e)
             raise
         except httpx.HTTPError as e:
-            logger.error(f"HTTP delete_template: {e}")
+            logger.error("HTTP delete_template: %s", e)
             raise
 
 
@@ -345,10 +344,10 @@ async def create_feed_account(
     except httpx.HTTPStatusError as e:
         if e.response.status_code in (401, 403):
             raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED, detail="Invalid credentials")
-        logger.error(f"HTTP create_feed_account: {e}")
+        logger.error("HTTP create_feed_account: %s", e)
         raise
     except httpx.HTTPError as e:
-        logger.error(f"HTTP create_feed_account: {e}")
+        logger.error("HTTP create_feed_account: %s", e)
         raise
 
 
@@ -373,7 +372,7 @@ async def reset_feed_account_password(
                 raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail=f"{request.account_name} not found.")
 
             user_role_id = rss_monk.ensure_limited_user_role_exists()
-            list_role_id = rss_monk.ensure_list_role_by_hash(request.account_name.replace(FEED_ACCOUNT_PREFIX, ""))
+            list_role_id = rss_monk.ensure_list_role_by_hash(request.account_name.removeprefix(FEED_ACCOUNT_PREFIX))
 
             # Delete existing user first (Listmonk only returns token on creation)
             # TODO - Update when listmonk provides and API token reset mechanism
@@ -385,8 +384,8 @@ async def reset_feed_account_password(
     except httpx.HTTPStatusError as e:
         if e.response.status_code in (401, 403):
             raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED, detail="Invalid credentials")
-        logger.error(f"HTTP reset_feed_account_password: {e}")
+        logger.error("HTTP reset_feed_account_password: %s", e)
         raise
     except httpx.HTTPError as e:
-        logger.error(f"HTTP reset_feed_account_password: {e}")
+        logger.error("HTTP reset_feed_account_password: %s", e)
         raise
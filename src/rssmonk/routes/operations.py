@@ -41,7 +41,7 @@ async def health_check() -> HealthResponse:
 
         return HealthResponse(status="healthy", listmonk_status=listmonk_status)
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         return HealthResponse(status="unhealthy", error=str(e))
 
 
@@ -61,7 +61,7 @@ async def get_metrics(credentials: HTTPBasicCredentials = Depends(security)) ->
 
         return Response(content=data, media_type=CONTENT_TYPE_LATEST)
     except Exception as e:
-        logger.error(f"Metric check failed: {e}")
+        logger.error("Metric check failed: %s", e)
 
 
 @router.get("/api/cache/stats", summary="Cache Statistics", description="Get RSS feed and template cache statistics")
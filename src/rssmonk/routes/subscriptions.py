@@ -58,7 +58,7 @@ async def get_subscription_preferences(
     except ValueError as e:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
     except Exception as e:
-        logger.error(f"Subscription fetch failed: {e}")
+        logger.error("Subscription fetch failed: %s", e)
         raise HTTPException(status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail="Subscription retrieval failed")
 
 
@@ -90,8 +90,9 @@ async def subscribe(
 
         try:
             rss_monk.subscribe(request.email, feed_hash)
-            subscriber_uuid = rss_monk.get_subscriber_uuid(request.email)
-            subscriber_uuid = subscriber_uuid.replace("-", "")
+            # Fetched once after subscribing so its lists are current, then reused for the filter update
+            subscriber = rss_monk.get_subscriber(request.email)
+            subscriber_uuid = subscriber["uuid"].replace("-", "")
 
             if len(request.filter.keys()) > 1:
                 raise HTTPException(
@@ -101,7 +102,7 @@ async def subscribe(
             frequency = list(request.filter.keys())[0]
 
             pending_uuid = rss_monk.update_subscriber_filter(
-                request.email, request.filter, feed_hash, bypass_confirmation=bypass_confirmation
+                request.email, request.filter, feed_hash, bypass_confirmation=bypass_confirmation, subscriber=subscriber
             )
             if not bypass_confirmation:
                 feed_data = rss_monk.get_feed_by_hash(feed_hash)
@@ -164,10 +165,9 @@ async def confirm_subscription(request: SubscribeConfirmRequest, credentials: HT
             feed_hash = extract_feed_hash(credentials.username)
 
             subscriber_uuid = request.subscriber_id
-            sub_list = rss_monk.get_admin_client().get_subscribers(query=f"subscribers.uuid='{subscriber_uuid}'")
+            subs = rss_monk.get_admin_client().find_subscriber("uuid", subscriber_uuid)
 
             req_uuid = request.guid
-            subs = sub_list[0] if (isinstance(sub_list, list) and len(sub_list) > 0) else None
             if not subs:
                 raise HTTPException(status_code=HTTPStatus.UNPROCESSABLE_ENTITY, detail="Invalid details")
 
@@ -220,7 +220,6 @@ async def unsubscribe(
             feed_hash = None
             token = None
             bypass_confirmation = False
-            subscriber_query = None
             is_valid_admin = get_settings().validate_admin_auth(credentials.username, credentials.password)
 
             if isinstance(request, UnsubscribeAdminRequest):
@@ -228,18 +227,17 @@ async def unsubscribe(
                     raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED)
                 bypass_confirmation = request.bypass_confirmation is not None and request.bypass_confirmation
                 feed_hash = make_url_hash(str(request.feed_url))
-                subscriber_query = f"subscribers.email='{request.email}'"
+                subscriber_column, subscriber_value = "email", request.email
             else:
                 if is_valid_admin:
                     raise HTTPException(status_code=HTTPStatus.UNPROCESSABLE_ENTITY, detail="")
                 feed_hash = get_feed_hash_from_username(credentials.username)
-                subscriber_query = f"subscribers.uuid='{request.subscriber_id}'"
+                subscriber_column, subscriber_value = "uuid", request.subscriber_id
                 token = request.token
 
             rss_monk.validate_feed_visibility(feed_hash)
 
-            sub_list = rss_monk.get_admin_client().get_subscribers(query=subscriber_query)
-            subscriber_details = sub_list[0] if (isinstance(sub_list, list) and len(sub_list) > 0) else None
+            subscriber_details = rss_monk.get_admin_client().find_subscriber(subscriber_column, subscriber_value)
             if not subscriber_details:
                 raise HTTPException(status_code=HTTPStatus.UNPROCESSABLE_ENTITY, detail="Invalid subscriber details")
 
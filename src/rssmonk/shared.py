@@ -26,6 +26,9 @@ class Settings(BaseSettings):
         alias="RSS_USER_AGENT",
         description="User agent for RSS requests",
     )
+    feed_concurrency: int = Field(
+        default=8, alias="FEED_CONCURRENCY", description="Maximum number of feeds processed at once"
+    )
 
     # Logging configuration
     log_level: str = Field(default="INFO", alias="LOG_LEVEL", description="Logging level")
@@ -51,7 +54,10 @@ class Settings(BaseSettings):
         # Only used as a quick check against settings (env vars) before going to work against Listmonk.
         # No real check against Listmonk. Could be done by getting user 1
         # TODO - Ping against Listmonk. Access it's own user_role and check for Super Admin as it's a reserved role.
-        return hmac.compare_digest(password, self.listmonk_admin_password) and username == self.listmonk_admin_username
+        # Compare both as bytes (str only accepts ASCII) and without short-circuiting, so timing leaks neither
+        password_ok = hmac.compare_digest(password.encode(), self.listmonk_admin_password.encode())
+        username_ok = hmac.compare_digest(username.encode(), self.listmonk_admin_username.encode())
+        return password_ok & username_ok
 
     @classmethod
     def ensure_env_file(cls) -> bool:
@@ -93,10 +99,11 @@ class Settings(BaseSettings):
                 env_content += "\n"
 
         try:
-            with open(env_path, "w", encoding="utf-8") as f:
+            # O_EXCL so a .env created by another worker since the check above is never overwritten
+            with os.fdopen(os.open(env_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), "w", encoding="utf-8") as f:
                 f.write(env_content)
             return True
-        except OSError:
+        except OSError:  # Includes FileExistsError
             return False
 
 
@@ -1,5 +1,4 @@
 from dataclasses import dataclass
-from datetime import datetime
 import os
 from enum import StrEnum
 from typing import Any
@@ -113,14 +112,15 @@ class ErrorMessages:
     NO_AUTH_FEED = "Not authorised to interact with this feed"
 
 
-@dataclass
+@dataclass(slots=True)
 class FeedItem:
-    """This stores one item from a parsed feed"""
+    """This stores one item from a parsed feed, slotted as a fetch builds one per feed entry"""
 
     title: str
     link: str
     description: str
-    published: datetime
+    published: str
+    """ISO 8601 in UTC, empty when the entry has no date"""
     guid: str
     email_subject_line: str
     """From wa:subject_line"""
@@ -1,5 +1,7 @@
 import hashlib
-from typing import Optional, Tuple
+import re
+from functools import lru_cache
+from typing import Collection, Optional, Tuple
 
 from rssmonk.types import FEED_ACCOUNT_PREFIX, ROLE_PREFIX, EmailPhaseType
 
@@ -29,7 +31,10 @@ def make_url_tag_from_hash(hash_str: str) -> str:
     return f"url:{hash_str}"
 
 
+@lru_cache(maxsize=1024)
 def make_url_hash(url: str) -> str:
+    # Cached as the same feed URL is hashed repeatedly within a request. The hash is persisted
+    # in Listmonk tags, template and account names, so the algorithm must not change.
     return hashlib.sha256(url.encode()).hexdigest()
 
 
@@ -38,7 +43,7 @@ def make_api_username(feed_url: str) -> str:
 
 
 def get_feed_hash_from_username(username: str) -> Optional[str]:
-    return username.replace(FEED_ACCOUNT_PREFIX, "").strip() if username.startswith(FEED_ACCOUNT_PREFIX) else None
+    return username.removeprefix(FEED_ACCOUNT_PREFIX).strip() if username.startswith(FEED_ACCOUNT_PREFIX) else None
 
 
 def make_list_role_name_by_url(url: str) -> str:
@@ -93,14 +98,64 @@ def expand_filter_identifiers(filter_freq_data: dict) -> Tuple[list[str], list[s
     return topic_categories_list, expanded_topics
 
 
+def make_filter_key(filter_freq_data: dict) -> tuple:
+    """Hashable form of a subscriber's filter, so subscribers with the same filter can share its expansion."""
+    return tuple(
+        sorted((key, tuple(item) if isinstance(item, list) else item) for key, item in filter_freq_data.items())
+    )
+
+
+_IDENTIFIER_SEPARATOR = re.compile(r"\s*,\s*")
+
+
+def split_filter_identifiers(filter_identifiers: str) -> frozenset[str]:
+    """Splits an article's comma separated identifiers, trimming whitespace in the same C-level pass."""
+    return frozenset(x for x in _IDENTIFIER_SEPARATOR.split(filter_identifiers.strip()) if x)
+
+
 def matches_filter(
-    categories_list: list[str], individual_topics_list: list[str], article_identifiers: list[str]
+    categories_list: Collection[str], individual_topics_list: Collection[str], article_identifiers: Collection[str]
 ) -> bool:
-    # Check if any category is present in article identifiers
-    category_match = any(
-        any(article.startswith(category) for article in article_identifiers) for category in categories_list
-    )
+    # Check if any category is present in article identifiers.
+    # str.startswith takes a tuple, so each identifier is checked against every category in one call.
+    if categories_list:
+        categories = tuple(categories_list)  # No copy when already a tuple
+        if any(article.startswith(categories) for article in article_identifiers):
+            return True
 
     # Check if any individual topic matches exactly
-    individual_match = bool(set(individual_topics_list) & set(article_identifiers))
-    return category_match or individual_match
+    return not frozenset(individual_topics_list).isdisjoint(article_identifiers)  # No copy when already frozen
+
+
+def build_identifier_bitmaps(article_identifiers_list: list[frozenset[str]]) -> dict[str, int]:
+    """Maps each article identifier to a bitmap of the articles carrying it, bit i for article i."""
+    bitmaps: dict[str, int] = {}
+    for index, identifiers in enumerate(article_identifiers_list):
+        bit = 1 << index
+        for identifier in identifiers:
+            bitmaps[identifier] = bitmaps.get(identifier, 0) | bit
+    return bitmaps
+
+
+def match_bitmap(
+    categories_list: Collection[str], individual_topics_list: Collection[str], bitmaps: dict[str, int]
+) -> int:
+    """Bitmap of the articles a filter matches, with the same rules as matches_filter."""
+    mask = 0
+    if categories_list:
+        categories = tuple(categories_list)
+        for identifier, bitmap in bitmaps.items():
+            if identifier.startswith(categories):
+                mask |= bitmap
+    for topic in individual_topics_list:
+        mask |= bitmaps.get(topic, 0)
+    return mask
+
+
+def bitmap_indices(mask: int) -> tuple[int, ...]:
+    """Indices of the set bits in a bitmap, lowest first."""
+    indices: list[int] = []
+    while mask:
+        indices.append((mask & -mask).bit_length() - 1)
+        mask &= mask - 1
+    return tuple(indices)
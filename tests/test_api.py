@@ -33,3 +33,15 @@ def test_health_endpoint():
     assert response.status_code == 200
     data = response.json()
     assert "status" in data
+
+
+def test_validate_admin_auth():
+    """Admin auth needs both username and password to match."""
+    from rssmonk.shared import Settings
+
+    settings = Settings(LISTMONK_ADMIN_USER="admin", LISTMONK_ADMIN_PASSWORD="test-token")
+
+    assert settings.validate_admin_auth("admin", "test-token")
+    assert not settings.validate_admin_auth("admin", "wrong-token")
+    assert not settings.validate_admin_auth("other", "test-token")
+    assert not settings.validate_admin_auth("adm\u00edn", "t\u00ebst-token")
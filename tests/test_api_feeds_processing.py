@@ -3,19 +3,24 @@ Test Feed API endpoints
 - /api/feeds
 """
 
+import asyncio
 from datetime import datetime, timedelta
 from http import HTTPStatus
 from multiprocessing import Process
 from fastapi.security import HTTPBasicCredentials
+import httpx
 import requests
 from requests.auth import HTTPBasicAuth
 import uvicorn
 import unittest
 from unittest.mock import patch, MagicMock
 
+from rssmonk import core
+from rssmonk.cache import FeedCache, close_feed_client, get_feed_client
 from rssmonk.core import RSSMonk
 from rssmonk.models import Feed
 from rssmonk.types import FeedItem, Frequency
+from rssmonk.utils import match_bitmap
 
 from tests.conftest import (
     RSSMONK_URL,
@@ -184,7 +189,7 @@ class TestPerformInstantEmailCheck(unittest.TestCase):
                 description="Desc 1",
                 email_subject_line="Subject 1",
                 filter_identifiers="min 0,port 143",
-                published=datetime.now(),
+                published=datetime.now().isoformat(),
                 guid="guid 1",
             ),
             FeedItem(
@@ -193,7 +198,7 @@ class TestPerformInstantEmailCheck(unittest.TestCase):
                 description="Desc 2",
                 email_subject_line="Subject 2",
                 filter_identifiers="min 1,port 565",
-                published=datetime.now() - timedelta(minutes=2),
+                published=(datetime.now() - timedelta(minutes=2)).isoformat(),
                 guid="guid 2",
             ),
             FeedItem(
@@ -202,7 +207,7 @@ class TestPerformInstantEmailCheck(unittest.TestCase):
                 description="Desc 3",
                 email_subject_line="Subject 3",
                 filter_identifiers="port 778",
-                published=datetime.now() - timedelta(minutes=4),
+                published=(datetime.now() - timedelta(minutes=4)).isoformat(),
                 guid="guid 3",
             ),
         ]
@@ -250,6 +255,46 @@ class TestPerformInstantEmailCheck(unittest.TestCase):
         self.assertIn("item", third_call_args[4])
         self.assertEqual(third_call_args[5], "Subject 3")
 
+    @patch("rssmonk.http_clients.ListmonkClient.send_transactional")
+    def test_email_check_matches_shared_filter_once(self, mock_send):
+        mock_send.return_value = None  # No actual sending
+        rssmonk = RSSMonk(local_creds=HTTPBasicCredentials(username="admin", password="admin123"))
+
+        feed = Feed(
+            email_base_url="https://example.com",
+            url_hash="hash123",
+            name="Example",
+            feed_url="https://example.com/rss",
+            poll_frequencies=[Frequency.INSTANT],
+        )
+        new_articles = [
+            FeedItem(
+                title=f"Article {i}",
+                link=f"https://example.com/{i}",
+                description=f"Desc {i}",
+                email_subject_line=f"Subject {i}",
+                filter_identifiers=f"min {i}",
+                published=datetime.now().isoformat(),
+                guid=f"guid {i}",
+            )
+            for i in range(3)
+        ]
+        subscribers = [
+            {"email": "one@example.com", "attribs": {"hash123": {"filter": {"instant": {"min": [1]}}}}},
+            {"email": "two@example.com", "attribs": {"hash123": {"filter": {"instant": {"min": [1]}}}}},
+        ]
+
+        with patch("rssmonk.core.match_bitmap", wraps=match_bitmap) as mock_match:
+            notifications_sent = rssmonk.perform_instant_email_check(
+                feed, Frequency.INSTANT, 101, new_articles, subscribers
+            )
+
+        # Identical filters are only matched against the articles once
+        self.assertEqual(mock_match.call_count, 1)
+        self.assertEqual(notifications_sent, 2)
+        self.assertEqual(mock_send.call_count, 1)
+        self.assertEqual(mock_send.call_args_list[0][0][3], ["one@example.com", "two@example.com"])
+
 
 class TestPerformDailyEmailCheck(unittest.TestCase):
     @patch("rssmonk.http_clients.ListmonkClient.send_transactional")
@@ -274,7 +319,7 @@ class TestPerformDailyEmailCheck(unittest.TestCase):
                 description="Desc 1",
                 email_subject_line="Subject 1",
                 filter_identifiers="min 0,port 143",
-                published=datetime.now(),
+                published=datetime.now().isoformat(),
                 guid="guid 1",
             ),
             FeedItem(
@@ -283,7 +328,7 @@ class TestPerformDailyEmailCheck(unittest.TestCase):
                 description="Desc 2",
                 email_subject_line="Subject 2",
                 filter_identifiers="min 1,port 565",
-                published=datetime.now() - timedelta(minutes=2),
+                published=(datetime.now() - timedelta(minutes=2)).isoformat(),
                 guid="guid 2",
             ),
             FeedItem(
@@ -292,7 +337,7 @@ class TestPerformDailyEmailCheck(unittest.TestCase):
                 description="Desc 3",
                 email_subject_line="Subject 3",
                 filter_identifiers="min 2,port 565",
-                published=datetime.now() - timedelta(minutes=4),
+                published=(datetime.now() - timedelta(minutes=4)).isoformat(),
                 guid="guid 3",
             ),
         ]
@@ -311,38 +356,42 @@ class TestPerformDailyEmailCheck(unittest.TestCase):
 
         # Check notifications sent and call count
         self.assertEqual(notifications_sent, 6)  # One for each user
-        self.assertEqual(mock_send.call_count, 5)  # One for each user and 1 which covers all
+        self.assertEqual(mock_send.call_count, 3)  # One for each distinct set of matched articles
 
-        # Inspect first filtered user call to send_transactional
+        # Inspect first call to send_transactional, which is for everyone receiving all articles
         first_call_args = mock_send.call_args_list[0][0]
         self.assertEqual(first_call_args[0], "noreply@noreply (No reply location)")
         self.assertEqual(first_call_args[1], template_id)
         self.assertEqual(first_call_args[2], "html")
-        self.assertEqual(first_call_args[3], ["one@example.com"])  # Single recipient
+        self.assertEqual(
+            first_call_args[3], ["user@example.com", "all@example.com", "four@example.com"]
+        )  # All-inclusive list and the category min filter that matches every article
         self.assertIn("items", first_call_args[4])  # 'items' is present
-        self.assertEqual(len(first_call_args[4]["items"]), 1, first_call_args[4]["items"])  # One article
-        self.assertEqual(first_call_args[4]["items"][0]["title"], "Article 1")  # Correct article that matches "min 0"
+        self.assertEqual(len(first_call_args[4]["items"]), 3, first_call_args[4]["items"])  # Three articles for all
+        self.assertEqual(first_call_args[4]["items"][0]["title"], "Article 1")
+        self.assertEqual(first_call_args[4]["items"][1]["title"], "Article 2")
+        self.assertEqual(first_call_args[4]["items"][2]["title"], "Article 3")
 
-        # Inspect second filtered user call to send_transactional
+        # Inspect second call to send_transactional, shared by the filters that only match the first article
         second_call_args = mock_send.call_args_list[1][0]
         self.assertEqual(second_call_args[0], "noreply@noreply (No reply location)")
         self.assertEqual(second_call_args[1], template_id)
         self.assertEqual(second_call_args[2], "html")
-        self.assertEqual(second_call_args[3], ["second@example.com"])  # All-inclusive list
+        self.assertEqual(second_call_args[3], ["one@example.com", "second@example.com"])
         self.assertIn("items", second_call_args[4])  # 'items' is present
         self.assertEqual(len(second_call_args[4]["items"]), 1, second_call_args[4]["items"])  # One article
         self.assertEqual(
             second_call_args[4]["items"][0]["title"], "Article 1"
-        )  # Correct article that matches "port 143"
+        )  # Correct article that matches "min 0" and "port 143"
 
         # Inspect third filtered user call to send_transactional
         third_call_args = mock_send.call_args_list[2][0]
         self.assertEqual(third_call_args[0], "noreply@noreply (No reply location)")
         self.assertEqual(third_call_args[1], template_id)
         self.assertEqual(third_call_args[2], "html")
-        self.assertEqual(third_call_args[3], ["three@example.com"])  # All-inclusive list
+        self.assertEqual(third_call_args[3], ["three@example.com"])  # Single recipient
         self.assertIn("items", third_call_args[4])  # 'items' is present
-        self.assertEqual(len(third_call_args[4]["items"]), 2, third_call_args[4]["items"])  # One article
+        self.assertEqual(len(third_call_args[4]["items"]), 2, third_call_args[4]["items"])  # Two articles
         self.assertEqual(
             third_call_args[4]["items"][0]["title"], "Article 1"
         )  # Correct article that matches "min 0, min 1"
@@ -350,36 +399,200 @@ class TestPerformDailyEmailCheck(unittest.TestCase):
             third_call_args[4]["items"][1]["title"], "Article 2"
         )  # Correct article that matches "min 0, min 1"
 
-        # Inspect fouth user call to send_transactional
-        fourth_call_args = mock_send.call_args_list[3][0]
-        self.assertEqual(fourth_call_args[0], "noreply@noreply (No reply location)")
-        self.assertEqual(fourth_call_args[1], template_id)
-        self.assertEqual(fourth_call_args[2], "html")
-        self.assertEqual(fourth_call_args[3], ["four@example.com"])
-        self.assertIn("items", fourth_call_args[4])  # 'items' is present
-        self.assertEqual(
-            len(fourth_call_args[4]["items"]), 3, fourth_call_args[4]["items"]
-        )  # Three articles for category min
-        self.assertEqual(fourth_call_args[4]["items"][0]["title"], "Article 1")
-        self.assertEqual(fourth_call_args[4]["items"][1]["title"], "Article 2")
-        self.assertEqual(fourth_call_args[4]["items"][2]["title"], "Article 3")
-
-        # Inspect fifth user call to send_transactional, which is for all
-        fifth_call_args = mock_send.call_args_list[4][0]
-        self.assertEqual(fifth_call_args[0], "noreply@noreply (No reply location)")
-        self.assertEqual(fifth_call_args[1], template_id)
-        self.assertEqual(fifth_call_args[2], "html")
-        self.assertEqual(fifth_call_args[3], ["user@example.com", "all@example.com"])  # All-inclusive list
-        self.assertIn("items", fifth_call_args[4])  # 'items' is present
-        self.assertEqual(len(fifth_call_args[4]["items"]), 3, fifth_call_args[4]["items"])  # Two articles for all
-        self.assertEqual(fifth_call_args[4]["items"][0]["title"], "Article 1")
-        self.assertEqual(fifth_call_args[4]["items"][1]["title"], "Article 2")
-        self.assertEqual(fifth_call_args[4]["items"][2]["title"], "Article 3")
+    def test_get_subscriber_filter(self):
+        daily = {"email": "a@example.com", "attribs": {"hash123": {"filter": {"daily": {"min": [0]}}}}}
+        self.assertEqual(RSSMonk._get_subscriber_filter(daily, "hash123", Frequency.DAILY), {"min": [0]})
+        self.assertEqual(RSSMonk._get_subscriber_filter(daily, "hash123", Frequency.INSTANT), "")
+        self.assertEqual(RSSMonk._get_subscriber_filter(daily, "other", Frequency.DAILY), "")
+        # Missing or null attribs levels read as no filter
+        self.assertEqual(RSSMonk._get_subscriber_filter({"email": "b@example.com"}, "hash123", Frequency.DAILY), "")
+        null_filter = {"email": "c@example.com", "attribs": {"hash123": {"filter": None}}}
+        self.assertEqual(RSSMonk._get_subscriber_filter(null_filter, "hash123", Frequency.DAILY), "")
+
+    @patch("rssmonk.http_clients.ListmonkClient.send_transactional")
+    def test_daily_email_check_skips_subscribers_without_filter(self, mock_send):
+        rssmonk = RSSMonk(local_creds=HTTPBasicCredentials(username="admin", password="admin123"))
+        feed = Feed(
+            email_base_url="https://example.com",
+            url_hash="hash123",
+            name="Example",
+            feed_url="https://example.com/rss",
+            poll_frequencies=[Frequency.DAILY],
+        )
+        new_articles = [
+            FeedItem(
+                title="Article 1",
+                link="https://example.com/1",
+                description="Desc 1",
+                email_subject_line="Subject 1",
+                filter_identifiers="min 0",
+                published=datetime.now().isoformat(),
+                guid="guid 1",
+            ),
+        ]
+        subscribers = [
+            {"email": "empty@example.com", "attribs": {"hash123": {"filter": {"daily": ""}}}},
+            {"email": "missing@example.com", "attribs": {}},
+            {"email": "all@example.com", "attribs": {"hash123": {"filter": {"daily": "all"}}}},
+        ]
+
+        notifications_sent = rssmonk.perform_daily_email_check(feed, Frequency.DAILY, 101, new_articles, subscribers)
+
+        self.assertEqual(notifications_sent, 1)
+        self.assertEqual(mock_send.call_count, 1)
+        self.assertEqual(mock_send.call_args_list[0][0][3], ["all@example.com"])
+
+
+class TestProcessFeedsByFrequency(unittest.TestCase):
+    """Tests for the bulk processing fan out."""
+
+    def _make_feed(self, name: str) -> Feed:
+        return Feed(
+            id=len(name),
+            email_base_url="https://example.com",
+            name=name,
+            feed_url=f"https://example.com/{name}",
+            poll_frequencies=[Frequency.INSTANT],
+        )
+
+    def test_failing_feed_does_not_stop_others(self):
+        rssmonk = RSSMonk(local_creds=HTTPBasicCredentials(username="admin", password="admin123"))
+        feeds = [self._make_feed("one"), self._make_feed("broken"), self._make_feed("three")]
+
+        async def process_feed(feed, frequency):
+            if feed.name == "broken":
+                raise RuntimeError("boom")
+            return 2, 1
+
+        with (
+            patch.object(rssmonk, "list_feeds", return_value=feeds) as mock_list_feeds,
+            patch.object(rssmonk, "_should_poll", return_value=True),
+            patch.object(rssmonk, "process_feed", side_effect=process_feed),
+        ):
+            results = asyncio.run(rssmonk.process_feeds_by_frequency(Frequency.INSTANT))
+
+        self.assertEqual(results, {"one": 2, "broken": 0, "three": 2})
+        mock_list_feeds.assert_called_once_with(Frequency.INSTANT)  # Filtered by Listmonk
+
+    def test_process_feed_runs_email_check_for_frequency(self):
+        rssmonk = RSSMonk(local_creds=HTTPBasicCredentials(username="admin", password="admin123"))
+        article = FeedItem(
+            title="Article 1",
+            link="https://example.com/1",
+            description="",
+            published=datetime.now().isoformat(),
+            guid="guid-1",
+            email_subject_line="",
+            filter_identifiers="",
+        )
+
+        async def get_feed(**kwargs):
+            return [article], "Example"
+
+        with (
+            patch("rssmonk.core.feed_cache.get_feed", side_effect=get_feed),
+            patch.object(rssmonk, "get_template_metadata", return_value=MagicMock(id=7)),
+            patch.object(rssmonk, "_get_seen_guids", return_value=set()),
+            patch.object(rssmonk, "get_client"),
+            patch.object(rssmonk, "_update_feed_state"),
+            patch.object(RSSMonk, "perform_instant_email_check", return_value=0) as mock_instant,
+            patch.object(RSSMonk, "perform_daily_email_check", return_value=3) as mock_daily,
+        ):
+            result = asyncio.run(rssmonk.process_feed(self._make_feed("one"), Frequency.DAILY))
+
+        self.assertEqual(result, (3, 1))
+        mock_daily.assert_called_once()
+        mock_instant.assert_not_called()
+
+
+class TestGetFeedName(unittest.TestCase):
+    """Tests for looking up a feed's title when no name is given."""
+
+    def setUp(self):
+        self.rssmonk = RSSMonk(local_creds=HTTPBasicCredentials(username="admin", password="admin123"))
+
+    @patch("rssmonk.core.feed_cache.get_cached_title", return_value=None)
+    @patch("rssmonk.core.httpx.get")
+    def test_title_fetched_with_timeout(self, mock_get, _):
+        mock_get.return_value = httpx.Response(
+            HTTPStatus.OK,
+            content=b"<rss><channel><title>Example feed</title></channel></rss>",
+            request=httpx.Request("GET", "https://example.com/rss"),
+        )
+
+        self.assertEqual(self.rssmonk._get_feed_name("https://example.com/rss"), "Example feed")
+        self.assertEqual(mock_get.call_args.kwargs["timeout"], self.rssmonk.settings.rss_timeout)
+
+    @patch("rssmonk.core.feed_cache.get_cached_title", return_value=None)
+    @patch("rssmonk.core.httpx.get")
+    def test_missing_title_falls_back_to_url(self, mock_get, _):
+        mock_get.return_value = httpx.Response(
+            HTTPStatus.OK,
+            content=b"<rss><channel></channel></rss>",
+            request=httpx.Request("GET", "https://example.com/rss"),
+        )
+
+        self.assertEqual(self.rssmonk._get_feed_name("https://example.com/rss"), "https://example.com/rss")
+
+    @patch("rssmonk.core.feed_cache.get_cached_title", return_value=None)
+    @patch("rssmonk.core.httpx.get", side_effect=httpx.ReadTimeout("timed out"))
+    def test_failed_fetch_falls_back_to_url(self, mock_get, _):
+        self.assertEqual(self.rssmonk._get_feed_name("https://example.com/rss"), "https://example.com/rss")
+
+    @patch("rssmonk.core.feed_cache.get_cached_title", return_value="Cached feed")
+    @patch("rssmonk.core.httpx.get")
+    def test_feed_cache_title_used(self, mock_get, _):
+        self.assertEqual(self.rssmonk._get_feed_name("https://example.com/rss"), "Cached feed")
+        mock_get.assert_not_called()
+
+
+class TestFeedCacheGetFeed(unittest.TestCase):
+    """Tests for parsing fetched feeds into articles."""
+
+    FEED = (
+        b"<rss><channel><title>Example feed</title>"
+        b"<item><title>Dated</title><guid>one</guid><pubDate>Mon, 06 Sep 2021 16:45:00 +0800</pubDate></item>"
+        b"<item><title>Undated</title><guid>two</guid></item>"
+        b"</channel></rss>"
+    )
+
+    def _get_feed(self):
+        transport = httpx.MockTransport(lambda request: httpx.Response(HTTPStatus.OK, content=self.FEED))
+
+        async def get_feed():
+            with patch("rssmonk.cache.get_feed_client", return_value=httpx.AsyncClient(transport=transport)):
+                return await FeedCache().get_feed("https://example.com/rss", "test-agent")
+
+        with patch.object(FeedCache, "_get_cached", return_value=None), patch.object(FeedCache, "_set_cached"):
+            return asyncio.run(get_feed())
+
+    def test_published_dates_parsed(self):
+        articles, title = self._get_feed()
+
+        self.assertEqual(title, "Example feed")
+        self.assertEqual(articles[0].published, "2021-09-06T08:45:00+00:00")
+        self.assertEqual(articles[1].published, "")
+
+    def test_feed_client_closed(self):
+        async def open_and_close():
+            client = get_feed_client()
+            await close_feed_client()
+            reopened = get_feed_client()
+            await close_feed_client()
+            return client, reopened
+
+        client, reopened = asyncio.run(open_and_close())
+
+        self.assertTrue(client.is_closed)
+        self.assertIsNot(reopened, client)
 
 
 class TestShouldPoll(unittest.TestCase):
     """Tests for the _should_poll method which controls when feeds are processed."""
 
+    def setUp(self):
+        core._parse_poll_time.cache_clear()
+
     def _make_rssmonk_with_mock_client(self):
         """Create RSSMonk with mocked Listmonk client."""
         rssmonk = RSSMonk(local_creds=HTTPBasicCredentials(username="admin", password="admin123"))
@@ -431,6 +644,36 @@ class TestShouldPoll(unittest.TestCase):
 
         self.assertTrue(result)
 
+    def test_list_fetched_once_per_pass(self):
+        """The feed's list is read once and reused by the later steps of the same pass."""
+        rssmonk = self._make_rssmonk_with_mock_client()
+        rssmonk._client.get.return_value = {"tags": ["freq:instant"]}
+
+        feed = self._make_feed([Frequency.INSTANT])
+        rssmonk._should_poll(Frequency.INSTANT, feed)
+        rssmonk._get_seen_guids(feed.id)
+
+        rssmonk._client.get.assert_called_once_with("/api/lists/1")
+
+    def test_listed_feeds_not_fetched_again(self):
+        """Lists read by list_feeds already carry their tags, so polling doesn't fetch them again."""
+        rssmonk = self._make_rssmonk_with_mock_client()
+        recent_time = (datetime.now() - timedelta(minutes=2)).isoformat()
+        rssmonk._client.get_lists.return_value = [
+            {
+                "id": 1,
+                "name": "Example",
+                "description": "RSS Feed: https://example.com/rss\nSubscription URL: https://example.com",
+                "tags": ["freq:instant", f"last-process:instant:{recent_time}"],
+            }
+        ]
+
+        feeds = rssmonk.list_feeds()
+        result = rssmonk._should_poll(Frequency.INSTANT, feeds[0])
+
+        self.assertFalse(result)
+        rssmonk._client.get.assert_not_called()
+
     # --- Daily frequency tests ---
 
     def test_daily_no_previous_poll_should_poll(self):
@@ -479,6 +722,16 @@ class TestShouldPoll(unittest.TestCase):
 
         self.assertTrue(result)
 
+    def test_daily_uses_given_now(self):
+        """Daily: The caller's now is used instead of the clock."""
+        rssmonk = self._make_rssmonk_with_mock_client()
+        yesterday_5pm = datetime(2026, 1, 20, 17, 0, 0).isoformat()
+        rssmonk._client.get.return_value = {"tags": [f"last-process:daily:{yesterday_5pm}"]}
+
+        feed = self._make_feed([Frequency.DAILY])
+        self.assertFalse(rssmonk._should_poll(Frequency.DAILY, feed, datetime(2026, 1, 21, 14, 0, 0)))
+        self.assertTrue(rssmonk._should_poll(Frequency.DAILY, feed, datetime(2026, 1, 21, 18, 0, 0)))
+
     @patch("rssmonk.core.datetime")
     def test_daily_after_5pm_already_polled_today_should_not_poll(self, mock_datetime):
         """Daily: Should NOT poll if already polled today after 5pm."""
@@ -533,6 +786,85 @@ class TestShouldPoll(unittest.TestCase):
 
         self.assertTrue(result)
 
+    # --- Tag state tests ---
+
+    def test_index_tags(self):
+        """Tags are sorted by kind, keeping colons in timestamps and GUIDs."""
+        index = RSSMonk._index_tags(
+            ["url:abc", "freq:instant", "last-process:instant:2026-01-21T17:00:00", "last-guid:instant:urn:x:1"]
+        )
+        self.assertEqual(index["freqs"], ["instant"])
+        self.assertEqual(index["last_process"], {"instant": "2026-01-21T17:00:00"})
+        self.assertEqual(index["last_guid"], {"instant": ["urn:x:1"]})
+        self.assertEqual(index["other"], ["url:abc"])
+
+    def test_update_feed_state_replaces_state_tags(self):
+        """Updating state keeps unrelated tags and replaces the frequency's state tags."""
+        rssmonk = self._make_rssmonk_with_mock_client()
+        rssmonk._client.get.return_value = {
+            "tags": ["url:abc", "freq:instant", "last-process:instant:2026-01-20T17:00:00", "last-guid:instant:old"]
+        }
+        article = FeedItem(
+            title="Article",
+            link="https://example.com/1",
+            description="",
+            email_subject_line="",
+            filter_identifiers="",
+            published=datetime.now().isoformat(),
+            guid="new",
+        )
+
+        rssmonk._update_feed_state(self._make_feed([Frequency.INSTANT]), Frequency.INSTANT, [article])
+
+        tags = rssmonk._client.put.call_args[0][1]["tags"]
+        self.assertEqual(tags[:2], ["url:abc", "freq:instant"])
+        self.assertTrue(tags[2].startswith("last-process:instant:"))
+        self.assertNotEqual(tags[2], "last-process:instant:2026-01-20T17:00:00")
+        self.assertEqual(tags[3:], ["last-guid:instant:new", "last-guid:instant:old"])
+
+    def test_update_feed_state_rereads_tags(self):
+        """State written by another frequency since the pass read the list isn't overwritten with the old copy."""
+        rssmonk = self._make_rssmonk_with_mock_client()
+        rssmonk._client.get.return_value = {"tags": ["freq:instant", "freq:daily"]}
+        feed = self._make_feed([Frequency.INSTANT, Frequency.DAILY])
+        rssmonk._get_seen_guids(feed.id)  # Index cached at the start of the pass
+
+        rssmonk._client.get.return_value = {
+            "tags": ["freq:instant", "freq:daily", "last-process:daily:2026-01-21T17:00:00"]
+        }
+        rssmonk._update_feed_state(feed, Frequency.INSTANT, [])
+
+        tags = rssmonk._client.put.call_args[0][1]["tags"]
+        self.assertIn("last-process:daily:2026-01-21T17:00:00", tags)
+
+    def test_get_seen_guids(self):
+        """Seen GUIDs are read from every last-guid tag."""
+        rssmonk = self._make_rssmonk_with_mock_client()
+        rssmonk._client.get.return_value = {"tags": ["freq:instant", "last-guid:instant:a", "last-guid:instant:b"]}
+
+        self.assertEqual(rssmonk._get_seen_guids(1), {"a", "b"})
+
+    def test_find_new_articles_stops_at_any_seen_guid(self):
+        """New articles run up to the first recently seen GUID, even if the latest one was removed."""
+        articles = [
+            FeedItem(
+                title=guid,
+                link=f"https://example.com/{guid}",
+                description="",
+                email_subject_line="",
+                filter_identifiers="",
+                published=datetime.now().isoformat(),
+                guid=guid,
+            )
+            for guid in ("a", "b", "c")
+        ]
+
+        new_articles = RSSMonk._find_new_articles({"removed", "b"}, articles)
+
+        self.assertEqual([article.guid for article in new_articles], ["a"])
+        self.assertEqual(RSSMonk._find_new_articles(set(), articles), articles)
+        self.assertEqual(RSSMonk._find_new_articles({"a"}, articles), [])
+
 
 class TestFeedProcessingWithMockServer(ListmonkClientTestBase):
     """Integration tests for feed processing using mock RSS server with email content verification."""
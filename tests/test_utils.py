@@ -2,12 +2,17 @@ import hashlib
 import unittest
 
 from rssmonk.utils import (
+    bitmap_indices,
+    build_identifier_bitmaps,
     expand_filter_identifiers,
     extract_feed_hash,
+    make_filter_key,
     make_filter_url,
+    match_bitmap,
     matches_filter,
     numberfy_subbed_lists,
     remove_other_keys,
+    split_filter_identifiers,
 )
 
 """
@@ -136,6 +141,26 @@ class TestExpandFilterIdentifiers(unittest.TestCase):
         self.assertEqual(topics, ["topic1 1", "topic3 3", "topic3 4"])
 
 
+class TestMakeFilterKey(unittest.TestCase):
+    def test_same_filter_same_key(self):
+        key = make_filter_key({"min": [0, 1], "port": "all"})
+        self.assertEqual(key, make_filter_key({"port": "all", "min": [0, 1]}))
+        self.assertEqual(hash(key), hash(make_filter_key({"port": "all", "min": [0, 1]})))
+
+    def test_different_filter_different_key(self):
+        self.assertNotEqual(make_filter_key({"min": [0]}), make_filter_key({"min": [1]}))
+        self.assertNotEqual(make_filter_key({"min": "all"}), make_filter_key({"min": ["all"]}))
+
+
+class TestSplitFilterIdentifiers(unittest.TestCase):
+    def test_trims_whitespace(self):
+        self.assertEqual(split_filter_identifiers(" min 1 ,port 143,  reg 2 "), {"min 1", "port 143", "reg 2"})
+
+    def test_drops_empty_identifiers(self):
+        self.assertEqual(split_filter_identifiers("min 1,, "), {"min 1"})
+        self.assertEqual(split_filter_identifiers(""), frozenset())
+
+
 class TestMatchesFilter(unittest.TestCase):
     def test_group_filter_matches(self):
         # Category "min" is in article_identifiers
@@ -172,3 +197,36 @@ class TestMatchesFilter(unittest.TestCase):
     def test_all_empty(self):
         # Everything empty
         self.assertFalse(matches_filter([], [], []))
+
+    def test_frozen_inputs(self):
+        # Pre-frozen filters and identifiers, as used by the email checks
+        self.assertTrue(matches_filter(("reg",), frozenset(), frozenset({"reg 44", "other 345"})))
+        self.assertTrue(matches_filter((), frozenset({"min 1"}), frozenset({"min 1", "other 23"})))
+        self.assertFalse(matches_filter(("min",), frozenset({"reg 1"}), frozenset({"other 33"})))
+
+
+class TestMatchBitmap(unittest.TestCase):
+    def setUp(self):
+        self.bitmaps = build_identifier_bitmaps(
+            [frozenset({"min 0", "port 143"}), frozenset({"min 1", "port 565"}), frozenset({"reg 2", "port 565"})]
+        )
+
+    def test_build_identifier_bitmaps(self):
+        self.assertEqual(self.bitmaps["port 565"], 0b110)
+        self.assertEqual(self.bitmaps["min 0"], 0b001)
+
+    def test_topics_and_categories(self):
+        self.assertEqual(bitmap_indices(match_bitmap([], ["port 565"], self.bitmaps)), (1, 2))
+        self.assertEqual(bitmap_indices(match_bitmap(["min"], [], self.bitmaps)), (0, 1))
+        self.assertEqual(bitmap_indices(match_bitmap(["reg"], ["min 0"], self.bitmaps)), (0, 2))
+
+    def test_no_match(self):
+        self.assertEqual(match_bitmap(["other"], ["min 5"], self.bitmaps), 0)
+        self.assertEqual(bitmap_indices(0), ())
+
+    def test_agrees_with_matches_filter(self):
+        articles = [frozenset({"min 0", "port 143"}), frozenset({"min 1", "port 565"}), frozenset({"reg 2"})]
+        bitmaps = build_identifier_bitmaps(articles)
+        for categories, topics in [(["min"], []), ([], ["port 565"]), (["reg"], ["min 0"]), ([], [])]:
+            expected = tuple(i for i, ids in enumerate(articles) if matches_filter(categories, topics, ids))
+            self.assertEqual(bitmap_indices(match_bitmap(categories, topics, bitmaps)), expected)